@@ -1,3 +1,13 @@
+import multiprocessing
+import os
+import sys
+import warnings
+
+import numpy as np
+
+# R and L become + and - so np.fromstring can read signed distances
+DIRECTION_SIGNS = bytes.maketrans(b'RL', b'+-')
+
 def decode_secret_password(rotations_input):
     """
     Calculates the North Pole secret password, which is the number of times 
@@ -49,8 +59,285 @@ def decode_secret_password(rotations_input):
     print(f"Total times the dial landed on 0: {zero_count}")
     return zero_count
 
-# Dial input
-dial_input = """
+def parse_rotations(rotations_input):
+    """
+    Parses the whole L<n>/R<n> rotation log into two int64 arrays:
+    the direction of each rotation (+1 for R, -1 for L) and its distance.
+
+    Well-formed logs go through the single C-level parse in
+    _parse_signed_rotations. Anything odd (signs, stray characters, missing
+    distances) drops to a line-by-line parse that mirrors the scalar loop, so
+    the totals always agree with it. A zero distance may come back with a
+    direction of 0; it moves nothing either way.
+    """
+    if isinstance(rotations_input, str):
+        rotations_input = rotations_input.encode()
+    rotations_input = rotations_input.strip()
+
+    signed_distances = _parse_signed_rotations(rotations_input)
+    if signed_distances is None:
+        return _parse_rotations_fallback(rotations_input.decode())
+    return np.sign(signed_distances), np.abs(signed_distances)
+
+
+def _parse_signed_rotations(rotations_input):
+    """
+    Reads a stripped, well-formed log as one int64 array of signed distances
+    (+n for R, -n for L), or returns None when the fast parse can't be trusted.
+
+    R and L are translated to + and - and np.fromstring reads the lot in C.
+    Deleting the digits must leave exactly one direction per line, the parse
+    must read to the end, and every value must be under 10**18, since
+    np.fromstring clamps out-of-range values instead of complaining.
+    """
+    # Without its digits a well-formed log reads R\nL\nR...
+    skeleton = rotations_input.translate(None, b'0123456789')
+    line_count = (len(skeleton) + 1) // 2
+    if (
+        not rotations_input
+        or not rotations_input[-1:].isdigit()
+        or len(skeleton) != 2 * line_count - 1
+        or skeleton[1::2] != b'\n' * (line_count - 1)
+        or skeleton[0::2].translate(None, b'RL')
+    ):
+        return None
+
+    # A direction that isn't directly in front of its digits leaves a stray
+    # sign, which stops np.fromstring short of the end. A bare direction on
+    # the last line would be read as 0 instead, hence the digit check above
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            signed_distances = np.fromstring(
+                rotations_input.translate(DIRECTION_SIGNS), dtype=np.int64, sep='\n'
+            )
+    except (ValueError, DeprecationWarning):
+        return None
+
+    if signed_distances.size != line_count:
+        return None
+    if signed_distances.max() >= 10 ** 18 or signed_distances.min() <= -10 ** 18:
+        return None
+    return signed_distances
+
+
+def _parse_rotations_fallback(rotations_input):
+    """Line-by-line parse with the same skip rules as decode_secret_password."""
+    directions = []
+    distances = []
+    for rotation in rotations_input.strip().split('\n'):
+        try:
+            distance = int(rotation[1:])
+        except ValueError:
+            continue
+        if not -2 ** 63 <= distance < 2 ** 63:
+            raise ValueError(
+                f"Rotation {rotation!r} is too large for the array engines; "
+                "use decode_secret_password for distances past int64"
+            )
+        # Unknown directions still count as a step that leaves the dial alone
+        directions.append({'R': 1, 'L': -1}.get(rotation[0], 0))
+        distances.append(distance)
+    return np.array(directions, dtype=np.int64), np.array(distances, dtype=np.int64)
+
+
+def replay_rotations(directions, distances, start_position=50, DIAL_SIZE=100):
+    """
+    Replays a batch of rotations as array operations.
+
+    Positions are a cumulative sum of the signed shifts modulo DIAL_SIZE.
+    Returns (final_position, zero_count).
+    """
+    if distances.size == 0:
+        return start_position, 0
+
+    # Reducing each shift first keeps the running sum well inside int64
+    shifts = (directions * (distances % DIAL_SIZE)) % DIAL_SIZE
+    positions = (start_position + np.cumsum(shifts)) % DIAL_SIZE
+
+    zero_count = int(np.count_nonzero(positions == 0))
+    return int(positions[-1]), zero_count
+
+
+def replay_signed_rotations(signed_distances, start_position=50, DIAL_SIZE=100):
+    """
+    replay_rotations for the signed distances from _parse_signed_rotations.
+
+    While the unwrapped position (no modulo) fits in int64 it is a single
+    cumulative sum, and the dial sits on 0 exactly where that position is a
+    multiple of DIAL_SIZE. Logs that could overflow go through replay_rotations.
+    """
+    if signed_distances.size == 0:
+        return start_position, 0
+
+    largest = max(int(signed_distances.max()), -int(signed_distances.min()))
+    if (largest + 1) * signed_distances.size + start_position >= 2 ** 62:
+        return replay_rotations(
+            np.sign(signed_distances), np.abs(signed_distances), start_position, DIAL_SIZE
+        )
+
+    positions = np.cumsum(signed_distances)
+    positions += start_position
+
+    zero_count = int(np.count_nonzero(positions == positions // DIAL_SIZE * DIAL_SIZE))
+    return int(positions[-1]) % DIAL_SIZE, zero_count
+
+
+def decode_secret_password_vectorized(rotations_input):
+    """
+    Batch version of decode_secret_password: same password, no per-step loop or output.
+    """
+    if isinstance(rotations_input, str):
+        rotations_input = rotations_input.encode()
+    rotations_input = rotations_input.strip()
+
+    signed_distances = _parse_signed_rotations(rotations_input)
+    if signed_distances is not None:
+        _, zero_count = replay_signed_rotations(signed_distances)
+        return zero_count
+
+    directions, distances = _parse_rotations_fallback(rotations_input.decode())
+    _, zero_count = replay_rotations(directions, distances)
+    return zero_count
+
+
+def iter_rotation_chunks(rotation_stream, chunk_size=1 << 20, byte_limit=None):
+    """
+    Reads a binary rotation log chunk_size bytes at a time and yields the
+    (directions, distances) arrays for each run of complete lines.
+
+    A partial line at the end of a chunk is carried into the next one. When
+    byte_limit is given, reading stops after that many bytes.
+    """
+    leftover = b''
+    remaining = byte_limit
+
+    while remaining is None or remaining > 0:
+        chunk = rotation_stream.read(chunk_size if remaining is None else min(chunk_size, remaining))
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+
+        data = leftover + chunk
+        last_newline = data.rfind(b'\n')
+        if last_newline == -1:
+            leftover = data
+            continue
+        leftover = data[last_newline + 1:]
+
+        yield parse_rotations(data[:last_newline])
+
+    # The log may not end with a newline
+    if leftover.strip():
+        yield parse_rotations(leftover)
+
+
+def decode_secret_password_stream(rotation_stream, chunk_size=1 << 20):
+    """
+    Streaming version of decode_secret_password for logs too big to hold in memory.
+
+    Reads a binary file object (an open file or sys.stdin.buffer) through
+    iter_rotation_chunks, carrying the dial position and running total from one
+    chunk to the next, so memory stays at roughly one chunk whatever the log size.
+    """
+    current_position = 50
+    zero_count = 0
+
+    for directions, distances in iter_rotation_chunks(rotation_stream, chunk_size):
+        current_position, hits = replay_rotations(directions, distances, current_position)
+        zero_count += hits
+
+    return zero_count
+
+
+def shard_hit_table(directions, distances, DIAL_SIZE=100):
+    """
+    Summarises a shard of rotations as a function of the position it starts from.
+
+    Returns (net_shift, hits_by_start): the shard always moves the dial by
+    net_shift, and hits_by_start[s] is how many times it lands on 0 when the dial
+    starts at s. A landing after rotation i from start s happens when the prefix
+    shift is -s (mod DIAL_SIZE), so one bincount of the prefix shifts fills the table.
+    """
+    if distances.size == 0:
+        return 0, np.zeros(DIAL_SIZE, dtype=np.int64)
+
+    shifts = (directions * (distances % DIAL_SIZE)) % DIAL_SIZE
+    prefix_shifts = np.cumsum(shifts) % DIAL_SIZE
+    landings = np.bincount(prefix_shifts, minlength=DIAL_SIZE)
+
+    starts = np.arange(DIAL_SIZE)
+    return int(prefix_shifts[-1]), landings[(-starts) % DIAL_SIZE].astype(np.int64)
+
+
+def combine_shard_tables(first, second, DIAL_SIZE=100):
+    """
+    Composes two shard summaries from shard_hit_table, first followed by second.
+
+    Composition is associative, so shard summaries can be reduced in any grouping.
+    """
+    first_shift, first_hits = first
+    second_shift, second_hits = second
+    starts = np.arange(DIAL_SIZE)
+    hits = first_hits + second_hits[(starts + first_shift) % DIAL_SIZE]
+    return (first_shift + second_shift) % DIAL_SIZE, hits
+
+
+def _summarise_log_shard(shard):
+    """Process pool worker: builds the summary table for one byte range of a log."""
+    log_path, shard_start, shard_end, chunk_size, DIAL_SIZE = shard
+    summary = (0, np.zeros(DIAL_SIZE, dtype=np.int64))
+    with open(log_path, 'rb') as log_file:
+        log_file.seek(shard_start)
+        for directions, distances in iter_rotation_chunks(log_file, chunk_size, shard_end - shard_start):
+            summary = combine_shard_tables(
+                summary, shard_hit_table(directions, distances, DIAL_SIZE), DIAL_SIZE
+            )
+    return summary
+
+
+def decode_secret_password_parallel(log_path, workers=None, chunk_size=1 << 20, DIAL_SIZE=100):
+    """
+    Parallel prefix-scan version of decode_secret_password for huge log files.
+
+    The file is cut into one byte range per worker on line boundaries. Each worker
+    summarises its shard as a net shift plus a DIAL_SIZE-entry table of hits per
+    starting position, and a final scan threads the dial through those summaries.
+    """
+    workers = workers or os.cpu_count() or 1
+    log_size = os.path.getsize(log_path)
+
+    # Move every cut forward to the start of the next line
+    boundaries = [0]
+    with open(log_path, 'rb') as log_file:
+        for k in range(1, workers):
+            log_file.seek(log_size * k // workers)
+            log_file.readline()
+            boundaries.append(max(boundaries[-1], min(log_file.tell(), log_size)))
+    boundaries.append(log_size)
+
+    shards = [
+        (log_path, shard_start, shard_end, chunk_size, DIAL_SIZE)
+        for shard_start, shard_end in zip(boundaries, boundaries[1:])
+        if shard_end > shard_start
+    ]
+    with multiprocessing.Pool(min(workers, max(len(shards), 1))) as pool:
+        summaries = pool.map(_summarise_log_shard, shards)
+
+    # The dial starts at 50, reduced onto dials smaller than that
+    current_position = 50 % DIAL_SIZE
+    zero_count = 0
+    for net_shift, hits_by_start in summaries:
+        zero_count += int(hits_by_start[current_position])
+        current_position = (current_position + net_shift) % DIAL_SIZE
+
+    return zero_count
+
+
+if __name__ == "__main__":
+    # Dial input
+    dial_input = """
 L68
 L30
 R48
@@ -63,6 +350,30 @@ R14
 L82
 """
 
-# Execute the decoding function and store the result
-password = decode_secret_password(dial_input)
-print(f"\nThe actual password (the number of times the dial landed on 0) is: {password}")
+    # Execute the decoding function and store the result
+    password = decode_secret_password(dial_input)
+    print(f"\nThe actual password (the number of times the dial landed on 0) is: {password}")
+
+    # Cross-check the batch engine against the step-by-step replay
+    fast_password = decode_secret_password_vectorized(dial_input)
+    print(f"Vectorized engine password: {fast_password} (Matches: {fast_password == password})")
+
+    # A log cut off after its last direction has to skip that line, not read it as 0
+    cut_log = "R50\nL"
+    cut_password = decode_secret_password_vectorized(cut_log)
+    print(f"Cut-off log password: {cut_password} (Matches: {cut_password == decode_secret_password(cut_log)})")
+
+    # Stream a rotation log from a file (or '-' for stdin) without loading it whole.
+    # A worker count after the path splits the file across that many processes.
+    if len(sys.argv) > 2:
+        log_path, workers = sys.argv[1], int(sys.argv[2])
+        parallel_password = decode_secret_password_parallel(log_path, workers)
+        print(f"Parallel password from {log_path} ({workers} workers): {parallel_password}")
+    elif len(sys.argv) > 1:
+        log_path = sys.argv[1]
+        if log_path == '-':
+            streamed_password = decode_secret_password_stream(sys.stdin.buffer)
+        else:
+            with open(log_path, 'rb') as log_file:
+                streamed_password = decode_secret_password_stream(log_file)
+        print(f"Streamed password from {log_path}: {streamed_password}")
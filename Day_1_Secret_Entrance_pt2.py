@@ -1,3 +1,13 @@
+import multiprocessing
+import os
+import sys
+import warnings
+
+import numpy as np
+
+# R and L become + and - so np.fromstring can read signed distances
+DIRECTION_SIGNS = bytes.maketrans(b'RL', b'+-')
+
 def count_zero_hits(start_pos, distance, direction, DIAL_SIZE=100):
     """
     Calculates the number of times the dial points exactly at 0 during a 
@@ -41,6 +51,33 @@ def count_zero_hits(start_pos, distance, direction, DIAL_SIZE=100):
     return 0
 
 
+def count_target_hits(start_pos, distance, direction, target, DIAL_SIZE=100):
+    """
+    Closed-form generalisation of count_zero_hits to any target position.
+
+    The first click that lands on target is k0 = (target - start_pos) % DIAL_SIZE
+    for R (mirrored for L), or a full DIAL_SIZE when the dial starts on it. After
+    that it comes round again every DIAL_SIZE clicks, so no clicks are simulated
+    and dials of any size (10^12 and up) cost the same.
+    """
+    if distance <= 0:
+        return 0
+
+    if direction == 'R':
+        first_hit = (target - start_pos) % DIAL_SIZE
+    elif direction == 'L':
+        first_hit = (start_pos - target) % DIAL_SIZE
+    else:
+        return 0
+
+    if first_hit == 0:
+        first_hit = DIAL_SIZE
+
+    if distance < first_hit:
+        return 0
+    return 1 + (distance - first_hit) // DIAL_SIZE
+
+
 def decode_secret_password(rotations_input):
     """
     Calculates the new North Pole secret password (method 0x434C49434B lol), 
@@ -89,7 +126,393 @@ def decode_secret_password(rotations_input):
     print(f"Total times the dial landed on 0 (Password): {total_zero_hits}")
     return total_zero_hits
 
-dial_input = """
+def parse_rotations(rotations_input):
+    """
+    Parses the whole L<n>/R<n> rotation log into two int64 arrays:
+    the direction of each rotation (+1 for R, -1 for L) and its distance.
+
+    Well-formed logs go through the single C-level parse in
+    _parse_signed_rotations. Anything odd (signs, stray characters, missing
+    distances) drops to a line-by-line parse that mirrors the scalar loop, so
+    the totals always agree with it. A zero distance may come back with a
+    direction of 0; it moves nothing either way.
+    """
+    if isinstance(rotations_input, str):
+        rotations_input = rotations_input.encode()
+    rotations_input = rotations_input.strip()
+
+    signed_distances = _parse_signed_rotations(rotations_input)
+    if signed_distances is None:
+        return _parse_rotations_fallback(rotations_input.decode())
+    return np.sign(signed_distances), np.abs(signed_distances)
+
+
+def _parse_signed_rotations(rotations_input):
+    """
+    Reads a stripped, well-formed log as one int64 array of signed distances
+    (+n for R, -n for L), or returns None when the fast parse can't be trusted.
+
+    R and L are translated to + and - and np.fromstring reads the lot in C.
+    Deleting the digits must leave exactly one direction per line, the parse
+    must read to the end, and every value must be under 10**18, since
+    np.fromstring clamps out-of-range values instead of complaining.
+    """
+    # Without its digits a well-formed log reads R\nL\nR...
+    skeleton = rotations_input.translate(None, b'0123456789')
+    line_count = (len(skeleton) + 1) // 2
+    if (
+        not rotations_input
+        or not rotations_input[-1:].isdigit()
+        or len(skeleton) != 2 * line_count - 1
+        or skeleton[1::2] != b'\n' * (line_count - 1)
+        or skeleton[0::2].translate(None, b'RL')
+    ):
+        return None
+
+    # A direction that isn't directly in front of its digits leaves a stray
+    # sign, which stops np.fromstring short of the end. A bare direction on
+    # the last line would be read as 0 instead, hence the digit check above
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', DeprecationWarning)
+            signed_distances = np.fromstring(
+                rotations_input.translate(DIRECTION_SIGNS), dtype=np.int64, sep='\n'
+            )
+    except (ValueError, DeprecationWarning):
+        return None
+
+    if signed_distances.size != line_count:
+        return None
+    if signed_distances.max() >= 10 ** 18 or signed_distances.min() <= -10 ** 18:
+        return None
+    return signed_distances
+
+
+def _parse_rotations_fallback(rotations_input):
+    """Line-by-line parse with the same skip rules as decode_secret_password."""
+    directions = []
+    distances = []
+    for rotation in rotations_input.strip().split('\n'):
+        try:
+            distance = int(rotation[1:])
+        except ValueError:
+            continue
+        if not -2 ** 63 <= distance < 2 ** 63:
+            raise ValueError(
+                f"Rotation {rotation!r} is too large for the array engines; "
+                "use decode_secret_password for distances past int64"
+            )
+        # Unknown directions still count as a step that leaves the dial alone
+        directions.append({'R': 1, 'L': -1}.get(rotation[0], 0))
+        distances.append(distance)
+    return np.array(directions, dtype=np.int64), np.array(distances, dtype=np.int64)
+
+
+def count_zero_hits_vectorized(start_positions, distances, directions, DIAL_SIZE=100):
+    """
+    Array form of count_zero_hits, evaluated for every rotation at once.
+
+    A left turn from P reaches 0 after P clicks (a full DIAL_SIZE when P is 0),
+    which is the same as a right turn starting (DIAL_SIZE - P) % DIAL_SIZE clicks
+    short of 0, so both directions collapse to one floor division.
+    """
+    clicks_before_start = np.where(
+        directions > 0, start_positions, (DIAL_SIZE - start_positions) % DIAL_SIZE
+    )
+    hits = (clicks_before_start + distances) // DIAL_SIZE
+    # Zero-length, negative and unknown-direction steps never hit anything
+    return np.where((distances > 0) & (directions != 0), hits, 0)
+
+
+def dial_positions(directions, distances, start_position=50, DIAL_SIZE=100):
+    """
+    Returns the dial position after every rotation.
+
+    Each shift is reduced modulo DIAL_SIZE first, and the running sum is taken in
+    blocks short enough that it cannot overflow int64 even on a 10^12-click dial.
+    """
+    shifts = (directions * (distances % DIAL_SIZE)) % DIAL_SIZE
+    block = max(1, (2 ** 62) // DIAL_SIZE)
+
+    positions = np.empty_like(shifts)
+    current_position = start_position
+    for block_start in range(0, shifts.size, block):
+        block_positions = (current_position + np.cumsum(shifts[block_start:block_start + block])) % DIAL_SIZE
+        positions[block_start:block_start + block] = block_positions
+        current_position = int(block_positions[-1])
+    return positions
+
+
+def replay_rotations(directions, distances, start_position=50, DIAL_SIZE=100):
+    """
+    Replays a batch of rotations as array operations.
+
+    Positions are a cumulative sum of the signed shifts modulo DIAL_SIZE, and each
+    rotation's hits are counted from the position it started at.
+    Returns (final_position, total_zero_hits).
+    """
+    if distances.size == 0:
+        return start_position, 0
+
+    positions = dial_positions(directions, distances, start_position, DIAL_SIZE)
+    start_positions = np.concatenate(([start_position], positions[:-1]))
+
+    hits = count_zero_hits_vectorized(start_positions, distances, directions, DIAL_SIZE)
+    return int(positions[-1]), int(hits.sum())
+
+
+def replay_signed_rotations(signed_distances, start_position=50, DIAL_SIZE=100):
+    """
+    replay_rotations for the signed distances from _parse_signed_rotations.
+
+    While the unwrapped position p (no modulo) fits in int64 it is a single
+    cumulative sum. A right turn passes 0 once per multiple of DIAL_SIZE in
+    (p_before, p_after], which is the rise in floor(p / DIAL_SIZE); a left
+    turn once per multiple in [p_after, p_before), the drop in
+    floor((p - 1) / DIAL_SIZE). Both come out of one floor division, with no
+    per-rotation modulo. Logs that could overflow go through replay_rotations.
+    """
+    if signed_distances.size == 0:
+        return start_position, 0
+
+    largest = max(int(signed_distances.max()), -int(signed_distances.min()))
+    if (largest + 1) * signed_distances.size + start_position >= 2 ** 62:
+        return replay_rotations(
+            np.sign(signed_distances), np.abs(signed_distances), start_position, DIAL_SIZE
+        )
+
+    positions = np.cumsum(signed_distances)
+    positions += start_position
+
+    turns = positions // DIAL_SIZE
+    # floor((p - 1) / DIAL_SIZE) is one less exactly where p lands on 0
+    turns_before = turns - (positions == turns * DIAL_SIZE)
+    start_turns = start_position // DIAL_SIZE
+    start_turns_before = (start_position - 1) // DIAL_SIZE
+
+    # Right turns' rises in turns plus left turns' drops in turns_before is the
+    # same as right turns' rises in both, minus turns_before's net change
+    steps = np.diff(turns + turns_before, prepend=start_turns + start_turns_before)
+    right_turns = int(np.sum(steps, where=signed_distances > 0))
+    total_zero_hits = right_turns - (int(turns_before[-1]) - start_turns_before)
+
+    return int(positions[-1]) % DIAL_SIZE, total_zero_hits
+
+
+def decode_secret_password_vectorized(rotations_input):
+    """
+    Batch version of decode_secret_password: same password, no per-step loop or output.
+    """
+    if isinstance(rotations_input, str):
+        rotations_input = rotations_input.encode()
+    rotations_input = rotations_input.strip()
+
+    signed_distances = _parse_signed_rotations(rotations_input)
+    if signed_distances is not None:
+        _, total_zero_hits = replay_signed_rotations(signed_distances)
+        return total_zero_hits
+
+    directions, distances = _parse_rotations_fallback(rotations_input.decode())
+    _, total_zero_hits = replay_rotations(directions, distances)
+    return total_zero_hits
+
+def count_target_hits_batch(rotations_input, targets, DIAL_SIZE=100, start_position=50):
+    """
+    Counts how often the dial passes each of many target positions over a whole log.
+
+    Every rotation of q * DIAL_SIZE + r clicks passes every position q times, plus
+    once more for the r positions on the arc it sweeps past its last full turn.
+    Those arcs are sorted once, and each target is answered by two binary searches
+    (arcs started at or before it, minus arcs already ended), so the cost is
+    O((rotations + targets) log rotations) whatever the dial size.
+
+    Returns a dict mapping each target to its hit count.
+    """
+    directions, distances = parse_rotations(rotations_input)
+    targets = np.asarray(targets, dtype=np.int64)
+    if distances.size == 0:
+        return {int(target): 0 for target in targets}
+
+    positions = dial_positions(directions, distances, start_position, DIAL_SIZE)
+    start_positions = np.concatenate(([start_position], positions[:-1]))
+
+    # Zero-length, negative and unknown-direction steps never hit anything
+    counted = (distances > 0) & (directions != 0)
+    full_turns = int((distances[counted] // DIAL_SIZE).sum())
+
+    remainders = distances[counted] % DIAL_SIZE
+    arc_starts = np.where(
+        directions[counted] > 0,
+        start_positions[counted] + 1,
+        start_positions[counted] - remainders,
+    ) % DIAL_SIZE
+    arc_ends = arc_starts + remainders
+
+    # Arcs that run past the top of the dial are split into two pieces
+    wraps = arc_ends > DIAL_SIZE
+    starts = np.sort(np.concatenate((arc_starts, np.zeros(np.count_nonzero(wraps), dtype=np.int64))))
+    ends = np.sort(np.concatenate((np.minimum(arc_ends, DIAL_SIZE), arc_ends[wraps] - DIAL_SIZE)))
+
+    arcs_covering = np.searchsorted(starts, targets, side='right') - np.searchsorted(ends, targets, side='right')
+    hits = full_turns + arcs_covering
+    return {int(target): int(count) for target, count in zip(targets, hits)}
+
+
+def iter_rotation_chunks(rotation_stream, chunk_size=1 << 20, byte_limit=None):
+    """
+    Reads a binary rotation log chunk_size bytes at a time and yields the
+    (directions, distances) arrays for each run of complete lines.
+
+    A partial line at the end of a chunk is carried into the next one. When
+    byte_limit is given, reading stops after that many bytes.
+    """
+    leftover = b''
+    remaining = byte_limit
+
+    while remaining is None or remaining > 0:
+        chunk = rotation_stream.read(chunk_size if remaining is None else min(chunk_size, remaining))
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+
+        data = leftover + chunk
+        last_newline = data.rfind(b'\n')
+        if last_newline == -1:
+            leftover = data
+            continue
+        leftover = data[last_newline + 1:]
+
+        yield parse_rotations(data[:last_newline])
+
+    # The log may not end with a newline
+    if leftover.strip():
+        yield parse_rotations(leftover)
+
+
+def decode_secret_password_stream(rotation_stream, chunk_size=1 << 20):
+    """
+    Streaming version of decode_secret_password for logs too big to hold in memory.
+
+    Reads a binary file object (an open file or sys.stdin.buffer) through
+    iter_rotation_chunks, carrying the dial position and running total from one
+    chunk to the next, so memory stays at roughly one chunk whatever the log size.
+    """
+    current_position = 50
+    total_zero_hits = 0
+
+    for directions, distances in iter_rotation_chunks(rotation_stream, chunk_size):
+        current_position, hits = replay_rotations(directions, distances, current_position)
+        total_zero_hits += hits
+
+    return total_zero_hits
+
+
+def shard_hit_table(directions, distances, DIAL_SIZE=100):
+    """
+    Summarises a shard of rotations as a function of the position it starts from.
+
+    Returns (net_shift, hits_by_start): the shard always moves the dial by
+    net_shift, and hits_by_start[s] is how many times it passes 0 when the dial
+    starts at s.
+
+    A rotation of q * DIAL_SIZE + r clicks always hits 0 q times, plus once more
+    when it starts inside a window of r positions (the last r positions for R,
+    positions 1..r for L). Shifted back by the prefix before the rotation, those
+    windows become circular intervals of start positions, which a difference
+    array over a doubled dial adds up in one pass.
+    """
+    table = np.zeros(DIAL_SIZE, dtype=np.int64)
+    if distances.size == 0:
+        return 0, table
+
+    shifts = (directions * (distances % DIAL_SIZE)) % DIAL_SIZE
+    prefix_shifts = np.cumsum(shifts) % DIAL_SIZE
+    offsets = np.concatenate(([0], prefix_shifts[:-1]))
+
+    # Zero-length, negative and unknown-direction steps never hit anything
+    counted = (distances > 0) & (directions != 0)
+    full_turns = int((distances[counted] // DIAL_SIZE).sum())
+
+    remainders = distances % DIAL_SIZE
+    window_start = np.where(directions > 0, DIAL_SIZE - remainders, 1)
+    partial = counted & (remainders > 0)
+    interval_start = (window_start[partial] - offsets[partial]) % DIAL_SIZE
+    interval_end = interval_start + remainders[partial]
+
+    coverage = np.cumsum(
+        np.bincount(interval_start, minlength=2 * DIAL_SIZE + 1)
+        - np.bincount(interval_end, minlength=2 * DIAL_SIZE + 1)
+    )
+    table += full_turns + coverage[:DIAL_SIZE] + coverage[DIAL_SIZE:2 * DIAL_SIZE]
+    return int(prefix_shifts[-1]), table
+
+
+def combine_shard_tables(first, second, DIAL_SIZE=100):
+    """
+    Composes two shard summaries from shard_hit_table, first followed by second.
+
+    Composition is associative, so shard summaries can be reduced in any grouping.
+    """
+    first_shift, first_hits = first
+    second_shift, second_hits = second
+    starts = np.arange(DIAL_SIZE)
+    hits = first_hits + second_hits[(starts + first_shift) % DIAL_SIZE]
+    return (first_shift + second_shift) % DIAL_SIZE, hits
+
+
+def _summarise_log_shard(shard):
+    """Process pool worker: builds the summary table for one byte range of a log."""
+    log_path, shard_start, shard_end, chunk_size, DIAL_SIZE = shard
+    summary = (0, np.zeros(DIAL_SIZE, dtype=np.int64))
+    with open(log_path, 'rb') as log_file:
+        log_file.seek(shard_start)
+        for directions, distances in iter_rotation_chunks(log_file, chunk_size, shard_end - shard_start):
+            summary = combine_shard_tables(
+                summary, shard_hit_table(directions, distances, DIAL_SIZE), DIAL_SIZE
+            )
+    return summary
+
+
+def decode_secret_password_parallel(log_path, workers=None, chunk_size=1 << 20, DIAL_SIZE=100):
+    """
+    Parallel prefix-scan version of decode_secret_password for huge log files.
+
+    The file is cut into one byte range per worker on line boundaries. Each worker
+    summarises its shard as a net shift plus a DIAL_SIZE-entry table of hits per
+    starting position, and a final scan threads the dial through those summaries.
+    """
+    workers = workers or os.cpu_count() or 1
+    log_size = os.path.getsize(log_path)
+
+    # Move every cut forward to the start of the next line
+    boundaries = [0]
+    with open(log_path, 'rb') as log_file:
+        for k in range(1, workers):
+            log_file.seek(log_size * k // workers)
+            log_file.readline()
+            boundaries.append(max(boundaries[-1], min(log_file.tell(), log_size)))
+    boundaries.append(log_size)
+
+    shards = [
+        (log_path, shard_start, shard_end, chunk_size, DIAL_SIZE)
+        for shard_start, shard_end in zip(boundaries, boundaries[1:])
+        if shard_end > shard_start
+    ]
+    with multiprocessing.Pool(min(workers, max(len(shards), 1))) as pool:
+        summaries = pool.map(_summarise_log_shard, shards)
+
+    # The dial starts at 50, reduced onto dials smaller than that
+    current_position = 50 % DIAL_SIZE
+    total_zero_hits = 0
+    for net_shift, hits_by_start in summaries:
+        total_zero_hits += int(hits_by_start[current_position])
+        current_position = (current_position + net_shift) % DIAL_SIZE
+
+    return total_zero_hits
+
+if __name__ == "__main__":
+    dial_input = """
 L68
 L30
 R48
@@ -102,6 +525,30 @@ R14
 L82
 """
 
-password = decode_secret_password(dial_input)
-# Lets hope I didn't fuck this all up
-print(f"\nThe actual password (the total number of times the dial landed on 0) is: {password}") 
+    password = decode_secret_password(dial_input)
+    # Lets hope I didn't fuck this all up
+    print(f"\nThe actual password (the total number of times the dial landed on 0) is: {password}") 
+
+    # Cross-check the batch engine against the step-by-step replay
+    fast_password = decode_secret_password_vectorized(dial_input)
+    print(f"Vectorized engine password: {fast_password} (Matches: {fast_password == password})")
+
+    # A log cut off after its last direction has to skip that line, not read it as 0
+    cut_log = "R50\nL"
+    cut_password = decode_secret_password_vectorized(cut_log)
+    print(f"Cut-off log password: {cut_password} (Matches: {cut_password == decode_secret_password(cut_log)})")
+
+    # Stream a rotation log from a file (or '-' for stdin) without loading it whole.
+    # A worker count after the path splits the file across that many processes.
+    if len(sys.argv) > 2:
+        log_path, workers = sys.argv[1], int(sys.argv[2])
+        parallel_password = decode_secret_password_parallel(log_path, workers)
+        print(f"Parallel password from {log_path} ({workers} workers): {parallel_password}")
+    elif len(sys.argv) > 1:
+        log_path = sys.argv[1]
+        if log_path == '-':
+            streamed_password = decode_secret_password_stream(sys.stdin.buffer)
+        else:
+            with open(log_path, 'rb') as log_file:
+                streamed_password = decode_secret_password_stream(log_file)
+        print(f"Streamed password from {log_path}: {streamed_password}")
@@ -1,3 +1,7 @@
+import json
+import os
+from dataclasses import dataclass
+
 def is_invalid_id(n):
     """
     Checks if a number n is an 'invalid ID'.
@@ -22,48 +26,300 @@ def is_invalid_id(n):
     
     return first_half == second_half
 
-def sum_invalid_ids(ranges_input):
+def iter_invalid_ids(start_id, end_id):
     """
-    Parses the input string of ranges and calculates the sum of all invalid IDs
-    found within those ranges.
-    Damn elf children.
+    Yields every invalid ID in [start_id, end_id] in increasing order without
+    scanning the range.
+    An ID of 2L digits made of block X twice is X * (10^L + 1), so for each even
+    digit length only the blocks whose multiple lands inside the range are visited.
     """
-    total_sum_of_invalid_ids = 0
-    
-    # Remove all whitespace and split the input string by comma
-    ranges_list = ranges_input.replace(" ", "").split(',')
-    
-    print("--- Invalid Product ID Analysis ---")
-    
-    for range_entry in ranges_list:
+    if end_id < 1 or start_id > end_id:
+        return
+
+    for length in range(len(str(max(start_id, 1))), len(str(end_id)) + 1):
+        if length % 2 != 0:
+            continue
+
+        half_length = length // 2
+        multiplier = 10 ** half_length + 1
+
+        # Blocks must have exactly half_length digits and keep X * multiplier in range
+        lowest_block = max(10 ** (half_length - 1), -(-start_id // multiplier))
+        highest_block = min(10 ** half_length - 1, end_id // multiplier)
+
+        for block in range(lowest_block, highest_block + 1):
+            yield block * multiplier
+
+def _block_bounds(length, block_length, start_id, end_id):
+    """
+    Returns (multiplier, lowest_block, highest_block): the block_length-digit
+    blocks whose repeat block * multiplier is a length-digit number in
+    [start_id, end_id]. The run is empty when highest_block < lowest_block.
+    """
+    # X repeated N times is X * (10^(L*N) - 1) / (10^L - 1)
+    multiplier = (10 ** length - 1) // (10 ** block_length - 1)
+    lowest_block = max(10 ** (block_length - 1), -(-start_id // multiplier))
+    highest_block = min(10 ** block_length - 1, end_id // multiplier)
+    return multiplier, lowest_block, highest_block
+
+def _block_series(length, block_length, start_id, end_id):
+    """
+    Returns (count, total) of the length-digit numbers in [start_id, end_id] that
+    are a block_length-digit block repeated length // block_length times.
+
+    Those numbers are block * multiplier for a run of consecutive blocks, so the
+    total is an arithmetic series and needs no enumeration.
+    """
+    multiplier, lowest_block, highest_block = _block_bounds(length, block_length, start_id, end_id)
+    if highest_block < lowest_block:
+        return 0, 0
+    count = highest_block - lowest_block + 1
+    return count, multiplier * (lowest_block + highest_block) * count // 2
+
+def invalid_id_totals(start_id, end_id):
+    """
+    Returns (count, total) of the invalid IDs in [start_id, end_id] in closed form.
+    Each even digit length contributes one arithmetic series of X * (10^L + 1).
+    """
+    if end_id < 1 or start_id > end_id:
+        return 0, 0
+
+    count = total = 0
+    for length in range(len(str(max(start_id, 1))), len(str(end_id)) + 1):
+        if length % 2 == 0:
+            length_count, length_total = _block_series(length, length // 2, start_id, end_id)
+            count += length_count
+            total += length_total
+    return count, total
+
+def _extreme_invalid_id(start_id, end_id, smallest):
+    """
+    Returns the smallest (or largest) invalid ID in [start_id, end_id], or None.
+    Digit lengths are tried from the near end, and within a length the
+    extreme block of each repeat class gives the answer directly.
+    """
+    if end_id < 1 or start_id > end_id:
+        return None
+
+    lengths = range(len(str(max(start_id, 1))), len(str(end_id)) + 1)
+    if not smallest:
+        lengths = reversed(lengths)
+    for length in lengths:
+        if length % 2 != 0:
+            continue
+        multiplier, lowest_block, highest_block = _block_bounds(length, length // 2, start_id, end_id)
+        if lowest_block <= highest_block:
+            return (lowest_block if smallest else highest_block) * multiplier
+    return None
+
+@dataclass
+class RangeSummary:
+    """Compact result for one range: how many invalid IDs, their sum, and the extremes."""
+    start_id: int
+    end_id: int
+    count: int
+    total: int
+    smallest: int | None
+    largest: int | None
+
+    def iter_ids(self):
+        """Lazily yields the invalid IDs in this range in increasing order."""
+        return iter_invalid_ids(self.start_id, self.end_id)
+
+def summarize_invalid_ids(ranges_input):
+    """
+    Returns a RangeSummary for every range in the input, in input order,
+    without listing or printing any IDs.
+    """
+    summaries = []
+    for start_id, end_id in parse_ranges(ranges_input):
+        count, total = invalid_id_totals(start_id, end_id)
+        summaries.append(RangeSummary(
+            start_id, end_id, count, total,
+            _extreme_invalid_id(start_id, end_id, smallest=True),
+            _extreme_invalid_id(start_id, end_id, smallest=False),
+        ))
+    return summaries
+
+def parse_ranges(ranges_input):
+    """
+    Parses the comma-separated range list into (start_id, end_id) tuples,
+    reporting and skipping malformed entries. Every range reader in this file
+    goes through here.
+    """
+    ranges = []
+    for range_entry in ranges_input.replace(" ", "").split(','):
         if not range_entry:
             continue
-            
         try:
-            # Split the range into start and end values
             start_str, end_str = range_entry.split('-')
-            start_id = int(start_str)
-            end_id = int(end_str)
+            ranges.append((int(start_str), int(end_str)))
         except ValueError:
             print(f"Skipping malformed range entry: {range_entry}")
+    return ranges
+
+def sum_invalid_ids(ranges_input, closed_form=False, verbose=False):
+    """
+    Parses the input string of ranges and calculates the sum of all invalid IDs
+    found within those ranges.
+    With closed_form=True each range is answered by invalid_id_totals without
+    listing its IDs, which stays instant however wide the range is.
+    Per-range output (including every invalid ID) is only printed with verbose=True.
+    Damn elf children.
+    """
+    total_sum_of_invalid_ids = 0
+    
+    if verbose:
+        print("--- Invalid Product ID Analysis ---")
+    
+    # parse_ranges strips the whitespace, splits on commas and skips malformed entries
+    for start_id, end_id in parse_ranges(ranges_input):
+        range_entry = f"{start_id}-{end_id}"
+
+        if closed_form:
+            count_in_range, sum_in_range = invalid_id_totals(start_id, end_id)
+            total_sum_of_invalid_ids += sum_in_range
+            if verbose:
+                print(f"Range {range_entry}: Found {count_in_range} invalid IDs summing to {sum_in_range}")
             continue
 
         invalid_ids_in_range = []
         
-        # Iterate through all IDs in the specified range (inclusive) FINALLY WORKS AHAHAH
-        for current_id in range(start_id, end_id + 1):
-            if is_invalid_id(current_id):
-                total_sum_of_invalid_ids += current_id
+        # Only visit the IDs that are invalid by construction FINALLY WORKS AHAHAH
+        for current_id in iter_invalid_ids(start_id, end_id):
+            total_sum_of_invalid_ids += current_id
+            if verbose:
                 invalid_ids_in_range.append(current_id)
         
+        if not verbose:
+            continue
+
         # Detailed output for tracking and verification
         if invalid_ids_in_range:
             print(f"Range {range_entry}: Found {len(invalid_ids_in_range)} invalid IDs: {invalid_ids_in_range}")
         else:
             print(f"Range {range_entry}: No invalid IDs found.")
             
-    print("-" * 40)
-    print(f"Final Sum of all Invalid IDs: {total_sum_of_invalid_ids}")
+    if verbose:
+        print("-" * 40)
+        print(f"Final Sum of all Invalid IDs: {total_sum_of_invalid_ids}")
+    return total_sum_of_invalid_ids
+
+def merge_ranges(ranges):
+    """
+    Sorts the ranges and merges any that overlap or touch, so every ID is
+    covered by at most one range. Empty ranges (start > end) are dropped.
+    """
+    merged = []
+    for start_id, end_id in sorted(r for r in ranges if r[0] <= r[1]):
+        if merged and start_id <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end_id)
+        else:
+            merged.append([start_id, end_id])
+    return [(start_id, end_id) for start_id, end_id in merged]
+
+class InvalidIdPrefixCache:
+    """
+    Caches prefix totals F(x) = (count, sum) of the invalid IDs in [1, x].
+
+    Whole digit lengths are summed once and kept per length; prefix values at
+    queried endpoints are kept in a dict, so a repeated query is a lookup and a
+    new endpoint costs one invalid_id_totals call plus an O(1) insert. The cache
+    can be saved to and loaded from a JSON file between runs; the file records
+    which invalidity rule built it, and loading one built for another rule fails.
+    """
+    RULE = "repeated-twice"
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.length_totals = {}
+        self.point_totals = {}
+
+        if cache_path and os.path.exists(cache_path):
+            self.load(cache_path)
+
+    def _below_length(self, length):
+        """(count, sum) of every invalid ID with fewer than `length` digits."""
+        count = total = 0
+        for shorter_length in range(1, length):
+            if shorter_length not in self.length_totals:
+                self.length_totals[shorter_length] = invalid_id_totals(
+                    10 ** (shorter_length - 1), 10 ** shorter_length - 1
+                )
+            length_count, length_total = self.length_totals[shorter_length]
+            count += length_count
+            total += length_total
+        return count, total
+
+    def prefix(self, x):
+        """Returns (count, sum) of the invalid IDs in [1, x]."""
+        if x < 1:
+            return 0, 0
+        if x in self.point_totals:
+            return self.point_totals[x]
+
+        length = len(str(x))
+        below_count, below_total = self._below_length(length)
+        partial_count, partial_total = invalid_id_totals(10 ** (length - 1), x)
+        totals = (below_count + partial_count, below_total + partial_total)
+
+        self.point_totals[x] = totals
+        return totals
+
+    def query(self, start_id, end_id):
+        """Returns (count, sum) of the invalid IDs in [start_id, end_id]."""
+        if start_id > end_id:
+            return 0, 0
+        end_count, end_total = self.prefix(end_id)
+        start_count, start_total = self.prefix(start_id - 1)
+        return end_count - start_count, end_total - start_total
+
+    def load(self, cache_path):
+        with open(cache_path, 'r') as f:
+            data = json.load(f)
+
+        rule, version = data.get("rule"), data.get("version")
+        if rule != self.RULE or version != self.FORMAT_VERSION:
+            raise ValueError(
+                f"'{cache_path}' holds a cache for rule {rule!r} (version {version!r}), "
+                f"expected rule {self.RULE!r} (version {self.FORMAT_VERSION})"
+            )
+
+        self.length_totals = {int(length): tuple(totals) for length, totals in data["lengths"].items()}
+        self.point_totals = {x: (count, total) for x, count, total in data["points"]}
+
+    def save(self, cache_path=None):
+        cache_path = cache_path or self.cache_path
+        if not cache_path:
+            raise ValueError("No cache_path to save to: pass one here or to the constructor")
+
+        data = {
+            "rule": self.RULE,
+            "version": self.FORMAT_VERSION,
+            "lengths": {str(length): list(totals) for length, totals in self.length_totals.items()},
+            "points": [[x, count, total] for x, (count, total) in sorted(self.point_totals.items())],
+        }
+        with open(cache_path, 'w') as f:
+            json.dump(data, f)
+
+def sum_invalid_ids_bulk(ranges_input, cache=None):
+    """
+    Sums the invalid IDs over a whole range list at once.
+
+    Overlapping and repeated ranges are merged first, so an ID covered by
+    several entries is counted once. Each merged range is then answered from
+    the prefix cache (a fresh one unless one is passed in to be reused or saved).
+    """
+    cache = cache or InvalidIdPrefixCache()
+    merged = merge_ranges(parse_ranges(ranges_input))
+
+    total_sum_of_invalid_ids = 0
+    for start_id, end_id in merged:
+        _, sum_in_range = cache.query(start_id, end_id)
+        total_sum_of_invalid_ids += sum_in_range
+
+    print(f"Merged into {len(merged)} ranges, Final Sum of all Invalid IDs: {total_sum_of_invalid_ids}")
     return total_sum_of_invalid_ids
 
 range_input = """
@@ -71,5 +327,16 @@ range_input = """
 """
 
 # Lets cross our fingers.
-final_sum = sum_invalid_ids(range_input)
+final_sum = sum_invalid_ids(range_input, verbose=True)
 print(f"\nThe sum of the invalid IDs is: {final_sum}")
+
+closed_form_sum = sum_invalid_ids(range_input, closed_form=True, verbose=True)
+print(f"\nClosed-form sum of the invalid IDs: {closed_form_sum} (Matches: {closed_form_sum == final_sum})")
+
+# Overlapping ranges are merged, so this only matches when the list has no overlaps
+bulk_sum = sum_invalid_ids_bulk(range_input)
+print(f"\nBulk sum of the invalid IDs: {bulk_sum} (Matches: {bulk_sum == final_sum})")
+
+range_summaries = summarize_invalid_ids(range_input)
+summary_sum = sum(summary.total for summary in range_summaries)
+print(f"\nSummarised {len(range_summaries)} ranges, sum of the invalid IDs: {summary_sum} (Matches: {summary_sum == final_sum})")
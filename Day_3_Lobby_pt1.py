@@ -1,3 +1,24 @@
+def largest_joltage_digits(bank, k):
+    """
+    Returns the largest k-digit subsequence of bank (as a string) in one O(n) pass.
+
+    Digits are pushed onto a stack; while a smaller digit sits on top and we can
+    still afford to drop digits (n - k in total), it is popped, because putting
+    the bigger digit earlier always wins. Banks of k digits or fewer come back whole.
+    """
+    drops_left = len(bank) - k
+    if drops_left <= 0:
+        return bank
+
+    stack = []
+    for digit in bank:
+        while drops_left and stack and stack[-1] < digit:
+            stack.pop()
+            drops_left -= 1
+        stack.append(digit)
+
+    return "".join(stack[:k])
+
 def escalator_solve(banks_input):
     """
     Calculates the maximum possible two-digit joltage from each battery bank
@@ -9,29 +30,13 @@ def escalator_solve(banks_input):
         # I need to find the largest possible two-digit number (XY)
         # where (X) and (Y) are digits from the bank, and (X) appears before (Y).
 
-        max_joltage_for_bank = 0
-        n = len(bank)
-
-        # Iterate through every possible digit (X) as the tens digit (index i)
-        for i in range(n):
-            # Check if the character is a digit before converting BECAUSE ERRORS FUCK
-            if not bank[i].isdigit():
-                continue
-            tens_digit = int(bank[i])
-
-            # Iterate through every possible digit (Y) as the units digit (index j)
-            # Y must appear after X, so j starts at i + 1
-            for j in range(i + 1, n):
-                if not bank[j].isdigit(): #IDK WHY I NEED THIS BUT ITS NOT THERE ERRORS
-                    continue
-                units_digit = int(bank[j])
+        # Only digits can be batteries BECAUSE ERRORS FUCK
+        digits = "".join(c for c in bank if c.isdigit())
 
-                # Calculate the joltage
-                current_joltage = tens_digit * 10 + units_digit
-
-                # Keep track of the maximum joltage found so far
-                if current_joltage > max_joltage_for_bank:
-                    max_joltage_for_bank = current_joltage
+        # The best XY is the largest 2-digit subsequence, found in one pass
+        max_joltage_for_bank = 0
+        if len(digits) >= 2:
+            max_joltage_for_bank = int(largest_joltage_digits(digits, 2))
 
         total_output_joltage += max_joltage_for_bank
 
@@ -1,3 +1,26 @@
+import numpy as np
+
+def largest_joltage_digits(bank, k):
+    """
+    Returns the largest k-digit subsequence of bank (as a string) in one O(n) pass.
+
+    Digits are pushed onto a stack; while a smaller digit sits on top and we can
+    still afford to drop digits (n - k in total), it is popped, because putting
+    the bigger digit earlier always wins. Banks of k digits or fewer come back whole.
+    """
+    drops_left = len(bank) - k
+    if drops_left <= 0:
+        return bank
+
+    stack = []
+    for digit in bank:
+        while drops_left and stack and stack[-1] < digit:
+            stack.pop()
+            drops_left -= 1
+        stack.append(digit)
+
+    return "".join(stack[:k])
+
 def solve_bigger_joltage(banks_input, k=12):
     """
     Calculates the largest possible K-digit number from each battery bank
@@ -8,36 +31,8 @@ def solve_bigger_joltage(banks_input, k=12):
     bank_joltages = []
 
     for bank in banks_input:
-        joltage_digits = []
-        batteries_to_select = k
-        current_index = 0
-        n = len(bank)
-
-        while batteries_to_select > 0:
-            search_limit = n - batteries_to_select
-
-            # Find the largest digit in the current search window
-            max_digit = '0'
-            max_index = -1
-            
-            # Search from the current_index up to the search_limit
-            for i in range(current_index, search_limit + 1):
-                digit = bank[i]
-                
-                if digit > max_digit:
-                    max_digit = digit
-                    max_index = i
-            
-            # Select the largest digit found
-            joltage_digits.append(max_digit)
-            
-            # Move the starting point for the next search to be immediately after the digit we just selected.
-            current_index = max_index + 1
-            batteries_to_select -= 1
-        
-        # Join the selected digits to form the bank's joltage number
-        bank_joltage_str = "".join(joltage_digits)
-        bank_joltages.append(bank_joltage_str)
+        # Greedy max-digit selection, done as a single monotonic-stack pass
+        bank_joltages.append(largest_joltage_digits(bank, k))
 
     # Sum all the large joltage numbers.
     total_output_joltage = sum(int(j) for j in bank_joltages)
@@ -47,6 +42,138 @@ def solve_joltage(banks_text, k=12):
     banks_input = [line.strip() for line in banks_text.split('\n') if line.strip()]
     return solve_bigger_joltage(banks_input, k)
 
+def load_bank_matrix(banks_text):
+    """
+    Loads equal-width banks as one (banks x width) uint8 matrix of digit values.
+    Returns None when the banks are ragged or contain anything but digits.
+    """
+    banks_input = [line.strip() for line in banks_text.split('\n') if line.strip()]
+    if not banks_input or len({len(bank) for bank in banks_input}) != 1:
+        return None
+
+    raw = np.frombuffer("".join(banks_input).encode(), dtype=np.uint8)
+    if raw.size != len(banks_input) * len(banks_input[0]) or raw.min() < ord('0') or raw.max() > ord('9'):
+        return None
+    return (raw - ord('0')).reshape(len(banks_input), -1)
+
+def solve_joltage_vectorized(banks_text, k=12):
+    """
+    Same total as solve_joltage, but every bank picks its digits at once.
+
+    For the j-th pick every bank searches from just after its previous pick up
+    to the same last column (width - k + j). Each digit is keyed as
+    digit * width + (width - 1 - column), so the largest key in a window is its
+    leftmost largest digit, matching the greedy choice. One suffix max over the
+    first width - k + 1 columns answers every pick with a lookup; only the k - 1
+    columns the later windows add on the right are checked per pick.
+    Ragged input falls back to solve_joltage.
+    """
+    banks = load_bank_matrix(banks_text)
+    if banks is None:
+        return solve_joltage(banks_text, k)
+
+    bank_count, width = banks.shape
+    if width <= k:
+        return solve_joltage(banks_text, k)
+
+    key_type = np.int16 if 10 * width < 2 ** 15 else np.int64
+    keys = banks.astype(key_type)
+    keys *= width
+    keys += np.arange(width - 1, -1, -1, dtype=key_type)
+
+    # suffix_best[b, i] is the largest key in bank b from column i up to the
+    # first pick's last column
+    first_limit = width - k
+    suffix_best = np.maximum.accumulate(keys[:, first_limit::-1], axis=1)[:, ::-1]
+
+    rows = np.arange(bank_count)
+    current_index = np.zeros(bank_count, dtype=np.int64)
+    picked = np.empty((bank_count, k), dtype=np.uint8)
+
+    for pick in range(k):
+        best = np.where(
+            current_index <= first_limit,
+            suffix_best[rows, np.minimum(current_index, first_limit)],
+            -1,
+        )
+        if pick:
+            # The columns past the first window, hiding any a bank has passed
+            tail_columns = np.arange(first_limit + 1, first_limit + pick + 1)
+            tail = np.where(
+                tail_columns >= current_index[:, None],
+                keys[:, first_limit + 1:first_limit + pick + 1],
+                -1,
+            )
+            best = np.maximum(best, tail.max(axis=1))
+
+        picked[:, pick] = best // width
+        current_index = width - best % width
+
+    # int64 holds 18 digits; longer joltages are joined as Python ints.
+    # The total across banks can still pass int64, so it is summed in Python ints
+    if k <= 18:
+        values = picked.astype(np.int64) @ (10 ** np.arange(k - 1, -1, -1, dtype=np.int64))
+        return sum(values.tolist())
+    return sum(int("".join(map(str, row))) for row in picked)
+
+class JoltageIndex:
+    """
+    Sparse-table index over one bank for answering many k values.
+
+    levels[j][i] is the index of the leftmost largest digit in bank[i:i + 2**j].
+    Any window is covered by two overlapping power-of-two blocks, so each greedy
+    pick is an O(1) lookup. Building costs O(n log n) once; every k after that
+    costs O(k) and never re-scans the bank.
+    """
+    def __init__(self, bank):
+        self.bank = bank
+        self.levels = [list(range(len(bank)))]
+
+        span = 1
+        while 2 * span <= len(bank):
+            previous = self.levels[-1]
+            self.levels.append([
+                left if bank[left] >= bank[right] else right
+                for left, right in zip(previous, previous[span:])
+            ])
+            span *= 2
+
+    def leftmost_max(self, start, end):
+        """Index of the leftmost largest digit in bank[start:end + 1]."""
+        level = (end - start + 1).bit_length() - 1
+        left = self.levels[level][start]
+        right = self.levels[level][end - (1 << level) + 1]
+        return left if self.bank[left] >= self.bank[right] else right
+
+    def largest_joltage_digits(self, k):
+        """Same result as largest_joltage_digits(bank, k), using the index."""
+        n = len(self.bank)
+        if n <= k:
+            return self.bank
+
+        joltage_digits = []
+        current_index = 0
+        for pick in range(k):
+            max_index = self.leftmost_max(current_index, n - k + pick)
+            joltage_digits.append(self.bank[max_index])
+            current_index = max_index + 1
+        return "".join(joltage_digits)
+
+def solve_joltage_sweep(banks_text, k_values):
+    """
+    Returns {k: total joltage} for every k in k_values, building each bank's
+    JoltageIndex once and reusing it across the whole sweep.
+    """
+    banks_input = [line.strip() for line in banks_text.split('\n') if line.strip()]
+    totals = {k: 0 for k in k_values}
+
+    for bank in banks_input:
+        index = JoltageIndex(bank)
+        for k in totals:
+            totals[k] += int(index.largest_joltage_digits(k))
+
+    return totals
+
 the_data = """
 3223323232423342133321323321133325222233342332323323343713331321434231231232333333232334233323322122
 3422323123349134332433333333432333313333323413433133433343234433433334323333452433843344143323335344
@@ -252,3 +379,9 @@ the_data = """
 
 final_result = solve_joltage(the_data)
 print(f"Total Output Joltage: {final_result}")
+
+vectorized_result = solve_joltage_vectorized(the_data)
+print(f"Vectorized Output Joltage: {vectorized_result} (Matches: {vectorized_result == final_result})")
+
+sweep_results = solve_joltage_sweep(the_data, [2, 12, 50])
+print(f"Sweep Output Joltage: {sweep_results} (k=12 Matches: {sweep_results[12] == final_result})")
@@ -1,3 +1,11 @@
+import multiprocessing
+import os
+import sys
+
+import numpy as np
+
+from grid_loader import MappedGrid
+
 def solve_removal_process(diagram_input):
     # Parse this shit into a grid (list of lists of characters <3)
     grid = [list(line) for line in diagram_input.strip().split('\n') if line.strip()]
@@ -62,6 +70,368 @@ def solve_removal_process(diagram_input):
 
     return total_removed
 
+def removal_waves(diagram_input):
+    """
+    Runs the same removal process as solve_removal_process, but queue-driven,
+    and returns how many rolls each step removed.
+
+    Every roll keeps a running count of adjacent rolls. After a wave is removed
+    only the neighbours of the removed rolls can have become accessible, so
+    those are the only cells re-checked for the next wave. Each roll is removed
+    once and each removal touches 8 neighbours, so total work is O(cells).
+    """
+    grid = [line for line in diagram_input.strip().split('\n') if line.strip()]
+
+    if not grid or not grid[0]:
+        print("Error: The input diagram is empty or malformed.")
+        return []
+
+    rows = len(grid)
+    cols = len(grid[0])
+
+    # Flatten onto a grid with a one-cell empty border so neighbours never go out of bounds
+    stride = cols + 2
+    is_roll = bytearray(stride * (rows + 2))
+    for r, line in enumerate(grid):
+        for c, char in enumerate(line[:cols]):
+            if char == '@':
+                is_roll[(r + 1) * stride + c + 1] = 1
+
+    neighbor_offsets = [
+        -stride - 1, -stride, -stride + 1,
+        -1,                   1,
+        stride - 1,  stride,  stride + 1
+    ]
+
+    adjacent_rolls = [0] * len(is_roll)
+    rolls = [cell for cell, roll in enumerate(is_roll) if roll]
+    for cell in rolls:
+        adjacent_rolls[cell] = sum(is_roll[cell + offset] for offset in neighbor_offsets)
+
+    wave = [cell for cell in rolls if adjacent_rolls[cell] < 4]
+    waves = []
+
+    while wave:
+        # Remove the whole wave first so the step stays simultaneous
+        for cell in wave:
+            is_roll[cell] = 0
+        waves.append(len(wave))
+
+        frontier = set()
+        for cell in wave:
+            for offset in neighbor_offsets:
+                neighbor = cell + offset
+                if is_roll[neighbor]:
+                    adjacent_rolls[neighbor] -= 1
+                    frontier.add(neighbor)
+
+        wave = [cell for cell in frontier if adjacent_rolls[cell] < 4]
+
+    return waves
+
+def solve_removal_process_frontier(diagram_input):
+    """Same total as solve_removal_process, computed with removal_waves."""
+    return sum(removal_waves(diagram_input))
+
+def load_roll_grid(diagram_input):
+    """
+    Parses the diagram into a boolean NumPy array (True where there is a roll).
+    Short rows are padded with empty space to the width of the first row.
+    A MappedGrid is compared straight off its memory map, with no per-row strings.
+    """
+    if isinstance(diagram_input, MappedGrid):
+        return diagram_input.as_array() == ord('@')
+
+    lines = [line for line in diagram_input.strip().split('\n') if line.strip()]
+    if not lines or not lines[0]:
+        return np.zeros((0, 0), dtype=bool)
+
+    cols = len(lines[0])
+    padded = "".join(line[:cols].ljust(cols, '.') for line in lines)
+    raw = np.frombuffer(padded.encode(), dtype=np.uint8)
+    return (raw == ord('@')).reshape(len(lines), cols)
+
+def count_neighbors(rolls):
+    """
+    Counts the adjacent rolls of every cell at once: a 3x3 box sum minus the
+    centre, done as a row pass then a column pass over a zero-padded copy.
+    """
+    rows, cols = rolls.shape
+    padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = rolls
+
+    row_sums = padded[:, :-2] + padded[:, 1:-1] + padded[:, 2:]
+    return row_sums[:-2] + row_sums[1:-1] + row_sums[2:] - padded[1:-1, 1:-1]
+
+def solve_removal_process_numpy(diagram_input):
+    """
+    Same total as solve_removal_process with the grid held as a boolean array.
+
+    While waves are large, each step removes every accessible roll with one mask
+    operation and takes the removed rolls' box sum off the neighbour counts.
+    Once waves thin out, the remaining steps only update the flat indices
+    around the rolls just removed, so the long tail of small steps stays cheap.
+    """
+    rolls = load_roll_grid(diagram_input)
+    if rolls.size == 0:
+        print("Error: The input diagram is empty or malformed.")
+        return 0
+
+    # A one-cell empty border keeps flat-index neighbours in bounds later on
+    rolls = np.pad(rolls, 1)
+    adjacent_rolls = count_neighbors(rolls)
+    accessible = rolls & (adjacent_rolls < 4)
+    total_removed = 0
+
+    while True:
+        removed_in_step = int(np.count_nonzero(accessible))
+        if removed_in_step * 64 < rolls.size:
+            break
+
+        rolls &= ~accessible
+        adjacent_rolls -= count_neighbors(accessible)
+        total_removed += removed_in_step
+        accessible = rolls & (adjacent_rolls < 4)
+
+    stride = rolls.shape[1]
+    neighbor_offsets = np.array([
+        -stride - 1, -stride, -stride + 1,
+        -1,                   1,
+        stride - 1,  stride,  stride + 1
+    ])
+    flat_rolls = rolls.ravel()
+    flat_counts = adjacent_rolls.ravel()
+    wave = np.flatnonzero(accessible)
+
+    while wave.size:
+        flat_rolls[wave] = False
+        total_removed += wave.size
+
+        neighbors, hits = np.unique((wave[:, None] + neighbor_offsets).ravel(), return_counts=True)
+        flat_counts[neighbors] -= hits.astype(flat_counts.dtype)
+        wave = neighbors[flat_rolls[neighbors] & (flat_counts[neighbors] < 4)]
+
+    return total_removed
+
+class BitPackedGrid:
+    """
+    The roll diagram with one bit per cell: each row is a Python int where bit c
+    is set when column c holds a roll. A 10^4-wide row is about 1.3 KB instead
+    of 10^4 list slots plus character objects.
+
+    Neighbour counts are never stored. For a row, the eight neighbour planes
+    (rows above and below plus the row itself, shifted one column each way) are
+    added with bit-sliced adders, so every column of the row is counted at once
+    using word-level shifts, ANDs and XORs.
+    """
+    def __init__(self, rows, cols):
+        self.rows = rows
+        self.cols = cols
+        self.full_mask = (1 << cols) - 1
+
+    @classmethod
+    def from_diagram(cls, diagram_input):
+        lines = [line for line in diagram_input.strip().split('\n') if line.strip()]
+        cols = len(lines[0]) if lines else 0
+        # Anything that isn't a roll is empty space, as in the list-of-lists grid
+        to_bits = bytes(ord('1') if b == ord('@') else ord('0') for b in range(256))
+        # Reverse so that column 0 lands on bit 0
+        rows = [
+            int(line[:cols].ljust(cols, '.').encode('ascii', 'replace').translate(to_bits)[::-1] or b'0', 2)
+            for line in lines
+        ]
+        return cls(rows, cols)
+
+    @classmethod
+    def from_mapped(cls, mapped_grid):
+        """Packs a MappedGrid one row at a time straight from its memory map."""
+        cells = mapped_grid.as_array()
+        rows = [
+            int.from_bytes(np.packbits(cells[r] == ord('@'), bitorder='little').tobytes(), 'little')
+            for r in range(mapped_grid.rows)
+        ]
+        return cls(rows, mapped_grid.cols)
+
+    def roll_count(self):
+        return sum(row.bit_count() for row in self.rows)
+
+    def accessible_in_row(self, r):
+        """Bitmask of the rolls in row r that have fewer than four adjacent rolls."""
+        row = self.rows[r]
+        if not row:
+            return 0
+
+        above = self.rows[r - 1] if r > 0 else 0
+        below = self.rows[r + 1] if r + 1 < len(self.rows) else 0
+        mask = self.full_mask
+
+        planes = (
+            (above << 1) & mask, above, above >> 1,
+            (row << 1) & mask,          row >> 1,
+            (below << 1) & mask, below, below >> 1,
+        )
+
+        # Bit-sliced counter: bit c of (ones, twos, fours) is column c's count so far;
+        # anything reaching eight only matters as "at least four", so fours saturates
+        ones = twos = fours = 0
+        for plane in planes:
+            carry = ones & plane
+            ones ^= plane
+            carry_twos = twos & carry
+            twos ^= carry
+            fours |= carry_twos
+
+        return row & ~fours
+
+    def removal_step(self, rows_to_check):
+        """
+        Removes every accessible roll among rows_to_check simultaneously.
+        Returns {row index: removed bitmask} for the rows that lost rolls.
+        """
+        removed = {}
+        for r in rows_to_check:
+            accessible = self.accessible_in_row(r)
+            if accessible:
+                removed[r] = accessible
+        for r, accessible in removed.items():
+            self.rows[r] &= ~accessible
+        return removed
+
+def solve_removal_process_bitpacked(diagram_input):
+    """
+    Same total as solve_removal_process on a BitPackedGrid (packed from the
+    diagram text or straight from a MappedGrid). After the first
+    step only rows next to a row that just lost rolls can change, so only
+    those rows are re-checked.
+    """
+    if isinstance(diagram_input, MappedGrid):
+        grid = BitPackedGrid.from_mapped(diagram_input)
+    else:
+        grid = BitPackedGrid.from_diagram(diagram_input)
+    if not grid.rows or not grid.cols:
+        print("Error: The input diagram is empty or malformed.")
+        return 0
+
+    total_removed = 0
+    rows_to_check = range(len(grid.rows))
+
+    while True:
+        removed = grid.removal_step(rows_to_check)
+        if not removed:
+            break
+
+        total_removed += sum(accessible.bit_count() for accessible in removed.values())
+        rows_to_check = sorted({
+            neighbor
+            for r in removed
+            for neighbor in (r - 1, r, r + 1)
+            if 0 <= neighbor < len(grid.rows)
+        })
+
+    return total_removed
+
+def _tile_worker(conn, band_rows, cols):
+    """
+    Owns one horizontal band of a BitPackedGrid for the whole run.
+
+    Each round it receives the halo rows (the neighbouring bands' edge rows as
+    they stood at the start of the round), removes its accessible rolls, and
+    sends back how many it removed plus its own new first and last rows.
+    """
+    # Rows 0 and -1 are the halo; the band is everything in between
+    grid = BitPackedGrid([0] + band_rows + [0], cols)
+    last_band_row = len(band_rows)
+    rows_to_check = set(range(1, last_band_row + 1))
+
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+
+        top_halo, bottom_halo = message
+        if top_halo != grid.rows[0]:
+            grid.rows[0] = top_halo
+            rows_to_check.add(1)
+        if bottom_halo != grid.rows[-1]:
+            grid.rows[-1] = bottom_halo
+            rows_to_check.add(last_band_row)
+
+        removed = grid.removal_step(sorted(rows_to_check))
+        rows_to_check = {
+            neighbor
+            for r in removed
+            for neighbor in (r - 1, r, r + 1)
+            if 1 <= neighbor <= last_band_row
+        }
+
+        removed_in_step = sum(accessible.bit_count() for accessible in removed.values())
+        conn.send((removed_in_step, grid.rows[1], grid.rows[last_band_row]))
+
+    conn.close()
+
+def solve_removal_process_tiled(diagram_input, tiles=None):
+    """
+    Same total as solve_removal_process, with the grid split into horizontal
+    bands that each live in their own process.
+
+    Every step, each band gets a one-row halo on either side holding its
+    neighbours' edge rows, so all bands see the same start-of-step grid and
+    removal stays simultaneous. The edge rows that come back are exchanged as
+    the next step's halos, until a step where no band removes anything.
+    """
+    if isinstance(diagram_input, MappedGrid):
+        grid = BitPackedGrid.from_mapped(diagram_input)
+    else:
+        grid = BitPackedGrid.from_diagram(diagram_input)
+    if not grid.rows or not grid.cols:
+        print("Error: The input diagram is empty or malformed.")
+        return 0
+
+    tiles = max(1, min(tiles or os.cpu_count() or 1, len(grid.rows)))
+    bounds = [len(grid.rows) * k // tiles for k in range(tiles + 1)]
+
+    connections = []
+    workers = []
+    for start, end in zip(bounds, bounds[1:]):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        worker = multiprocessing.Process(
+            target=_tile_worker, args=(child_conn, grid.rows[start:end], grid.cols)
+        )
+        worker.start()
+        child_conn.close()
+        connections.append(parent_conn)
+        workers.append(worker)
+
+    first_rows = [grid.rows[start] for start in bounds[:-1]]
+    last_rows = [grid.rows[end - 1] for end in bounds[1:]]
+    # The parent only needs the band edges from here on
+    del grid
+
+    total_removed = 0
+    try:
+        while True:
+            for k, conn in enumerate(connections):
+                top_halo = last_rows[k - 1] if k > 0 else 0
+                bottom_halo = first_rows[k + 1] if k + 1 < tiles else 0
+                conn.send((top_halo, bottom_halo))
+
+            removed_in_step = 0
+            for k, conn in enumerate(connections):
+                removed, first_rows[k], last_rows[k] = conn.recv()
+                removed_in_step += removed
+
+            if removed_in_step == 0:
+                break
+            total_removed += removed_in_step
+    finally:
+        for conn in connections:
+            conn.send(None)
+            conn.close()
+        for worker in workers:
+            worker.join()
+
+    return total_removed
+
 puzzle_input = """
 @.@@@@.@@.@@@@.@@.@@@@@..@@@@@..@@.@@..@@@.@@@@@@@@...@@..@@@.@@@.....@@@@@..@@.@@@@@.@..@.@@.@@@@.@@@@@@..@..@.@@@@@..@@@.@@.@@...@@.@
 @..@@@@@.@@@@.....@@..@@@@.@@@@.@.@.@.@@@@@@@.@@@.@@.@@..@.@@@.@.@.@@@.@@@@@.@...@@.@@@..@@..@.@@@@.@.@@@@.@.@@..@@@@.@@....@@.@@@@@@@@
@@ -200,5 +570,24 @@ puzzle_input = """
 .@@@@@@@.@....@@.@@@.@@@@..@@@.@@.@.@@@@.@.@@..@@@@@@@@@@.@..@@@@@..@@.@.@.@@.@@@@...@..@.@.@@@@@.@@..@@.@@@.@.....@@@@.....@@@@.@@@@.@
 """
 
-result = solve_removal_process(puzzle_input)
-print(f"The total number of rolls of paper that can be removed is: {result}")
+if __name__ == "__main__":
+    result = solve_removal_process(puzzle_input)
+    print(f"The total number of rolls of paper that can be removed is: {result}")
+
+    frontier_result = solve_removal_process_frontier(puzzle_input)
+    print(f"Frontier engine total: {frontier_result} (Matches: {frontier_result == result})")
+
+    numpy_result = solve_removal_process_numpy(puzzle_input)
+    print(f"NumPy backend total: {numpy_result} (Matches: {numpy_result == result})")
+
+    bitpacked_result = solve_removal_process_bitpacked(puzzle_input)
+    print(f"Bit-packed grid total: {bitpacked_result} (Matches: {bitpacked_result == result})")
+
+    tiled_result = solve_removal_process_tiled(puzzle_input, tiles=4)
+    print(f"Tiled solver total: {tiled_result} (Matches: {tiled_result == result})")
+
+    # Run the bit-packed solver on a memory-mapped diagram file, e.g. a 1 GB warehouse map
+    if len(sys.argv) > 1:
+        with MappedGrid(sys.argv[1]) as mapped_grid:
+            file_result = solve_removal_process_bitpacked(mapped_grid)
+        print(f"Removable rolls in {sys.argv[1]}: {file_result}")
@@ -1,4 +1,164 @@
+import bisect
+import io
 import sys
+import warnings
+
+import numpy as np
+
+def merge_ranges(ranges):
+    """
+    Sorts (start, end) ranges and merges any that overlap or touch, returning
+    the disjoint merged ranges in increasing order.
+    """
+    if not ranges:
+        return []
+
+    # Sort the ranges by their start time lets get algorithmic BAYBAY
+    ranges = sorted(ranges, key=lambda x: x[0])
+
+    merged_ranges = []
+    current_start, current_end = ranges[0]
+
+    for next_start, next_end in ranges[1:]:
+        if next_start <= current_end + 1:
+            # Merge like its going out of business
+            current_end = max(current_end, next_end)
+        else:
+            merged_ranges.append((current_start, current_end))
+            current_start, current_end = next_start, next_end
+
+    merged_ranges.append((current_start, current_end))
+    return merged_ranges
+
+class FreshIndex:
+    """
+    Sorted, merged fresh ranges for fast membership checks.
+
+    The ranges are merged with the same logic as part 2, so they are disjoint
+    and sorted; a single bisect over the range starts finds the only range an ID
+    could fall in. Backwards ranges (start > end) never match, so they are dropped.
+    """
+    def __init__(self, fresh_ranges):
+        merged_ranges = merge_ranges([(start, end) for start, end in fresh_ranges if start <= end])
+        self.starts = [start for start, _ in merged_ranges]
+        self.ends = [end for _, end in merged_ranges]
+
+    def is_fresh(self, ingredient_id):
+        i = bisect.bisect_right(self.starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self.ends[i]
+
+    def count_fresh(self, ingredient_ids):
+        """
+        Counts the fresh IDs in a batch by sorting the IDs and sweeping them
+        against the intervals in one pass.
+        """
+        fresh_count = 0
+        i = 0
+        for ingredient_id in sorted(ingredient_ids):
+            # Skip the intervals that end before this ID
+            while i < len(self.ends) and self.ends[i] < ingredient_id:
+                i += 1
+            if i == len(self.ends):
+                break
+            if self.starts[i] <= ingredient_id:
+                fresh_count += 1
+        return fresh_count
+
+    def fresh_mask(self, ingredient_ids):
+        """
+        Vectorized membership for an int64 array of IDs: one np.searchsorted
+        against the range starts picks each ID's candidate range, and one
+        comparison against that range's end gives the boolean fresh mask.
+        """
+        try:
+            starts = np.array(self.starts, dtype=np.int64)
+            ends = np.array(self.ends, dtype=np.int64)
+        except OverflowError:
+            starts = ends = None
+        if starts is None or ingredient_ids.dtype == object:
+            # Past int64: check each ID with bisect on Python ints instead
+            return np.fromiter(
+                (self.is_fresh(ingredient_id) for ingredient_id in ingredient_ids),
+                dtype=bool, count=len(ingredient_ids),
+            )
+        if starts.size == 0:
+            return np.zeros(len(ingredient_ids), dtype=bool)
+
+        candidate = np.searchsorted(starts, ingredient_ids, side='right') - 1
+        return (candidate >= 0) & (ingredient_ids <= ends[np.maximum(candidate, 0)])
+
+def parse_id_array(available_ids_str):
+    """
+    Parses the ID section straight into an int64 array. NumPy's parser splits on
+    any whitespace and clamps huge values, so it is only trusted when every line
+    holds exactly one ID and nothing landed on the int64 bounds; anything else
+    falls back to the line-by-line parse with its usual warnings. IDs too big
+    for int64 come back as an object array of Python ints.
+    """
+    stripped = available_ids_str.strip()
+    raw = stripped.encode()
+    line_count = raw.count(b'\n') + 1
+    # With digits and signs gone, only the line breaks may be left, and no
+    # line may be a bare sign (numpy would read that as 0)
+    if (
+        raw
+        and raw.translate(None, b'0123456789+-') == b'\n' * (line_count - 1)
+        and raw[-1:].isdigit()
+        and b'-\n' not in raw
+        and b'+\n' not in raw
+    ):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error', DeprecationWarning)
+                ids = np.fromstring(raw, dtype=np.int64, sep='\n')
+        except (ValueError, DeprecationWarning):
+            ids = None
+
+        bounds = np.iinfo(np.int64)
+        if (
+            ids is not None
+            and ids.size == line_count
+            and ids.min() > bounds.min
+            and ids.max() < bounds.max
+        ):
+            return ids
+
+    available_ids = []
+    for line in stripped.split('\n'):
+        try:
+            available_ids.append(int(line.strip()))
+        except ValueError:
+            print(f"Warning: Skipping invalid ID format: {line}")
+    try:
+        return np.array(available_ids, dtype=np.int64)
+    except OverflowError:
+        return np.array(available_ids, dtype=object)
+
+def aoc_inventory_puzzle_numpy(data, return_mask=False):
+    """
+    Same fresh count as aoc_inventory_puzzle for inputs with millions of IDs:
+    the IDs are loaded as one int64 array and checked in a single vectorized
+    pass. With return_mask=True, returns (fresh_count, mask), where mask[i]
+    says whether the i-th parsed ID is fresh.
+    """
+    sections = data.strip().split('\n\n')
+    if len(sections) != 2:
+        print("Error: Input data must contain two sections separated by a blank line.")
+        return (0, np.zeros(0, dtype=bool)) if return_mask else 0
+
+    ranges_str, available_ids_str = sections
+
+    fresh_ranges = []
+    for line in ranges_str.strip().split('\n'):
+        try:
+            start, end = map(int, line.split('-'))
+            fresh_ranges.append((start, end))
+        except ValueError:
+            print(f"Warning: Skipping invalid range format: {line}")
+
+    mask = FreshIndex(fresh_ranges).fresh_mask(parse_id_array(available_ids_str))
+    fresh_count = int(np.count_nonzero(mask))
+    return (fresh_count, mask) if return_mask else fresh_count
 
 def aoc_inventory_puzzle(data):
     """
@@ -28,19 +188,51 @@ def aoc_inventory_puzzle(data):
         except ValueError:
             print(f"Warning: Skipping invalid ID format: {line}")
 
-    fresh_count = 0
-    
-    # Iterate BAYBAY
-    for ingredient_id in available_ids:
-        is_fresh = False
-        
-        # Check if the ID falls into ANY of the defined fresh ranges
-        for start, end in fresh_ranges:
-            if start <= ingredient_id <= end:
-                is_fresh = True
+    # One merged, sorted index instead of checking every range for every ID BAYBAY
+    fresh_count = FreshIndex(fresh_ranges).count_fresh(available_ids)
+
+    return fresh_count
+
+def aoc_inventory_puzzle_stream(lines):
+    """
+    Streaming version of aoc_inventory_puzzle for database files too big to load.
+
+    Takes any iterable of lines (an open file, sys.stdin). The ranges section is
+    read line by line into a FreshIndex; the ID section is then checked one line
+    at a time and never stored, so memory is bounded by the number of ranges.
+    """
+    lines = iter(lines)
+    fresh_ranges = []
+    seen_range = False
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            # Blank lines before the ranges are padding; after them, the divider
+            if seen_range:
                 break
-        
-        if is_fresh:
+            continue
+
+        seen_range = True
+        try:
+            start, end = map(int, line.split('-'))
+            fresh_ranges.append((start, end))
+        except ValueError:
+            print(f"Warning: Skipping invalid range format: {line}")
+
+    fresh_index = FreshIndex(fresh_ranges)
+    fresh_count = 0
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            ingredient_id = int(line)
+        except ValueError:
+            print(f"Warning: Skipping invalid ID format: {line}")
+            continue
+        if fresh_index.is_fresh(ingredient_id):
             fresh_count += 1
 
     return fresh_count
@@ -1233,3 +1425,18 @@ puzzle_input = """
 result = aoc_inventory_puzzle(puzzle_input)
 print("--- Inventory System Analysis ---")
 print(f"Total Fresh Ingredient IDs found: {result}")
+
+numpy_result = aoc_inventory_puzzle_numpy(puzzle_input)
+print(f"Vectorized fresh count: {numpy_result} (Matches: {numpy_result == result})")
+
+stream_result = aoc_inventory_puzzle_stream(io.StringIO(puzzle_input))
+print(f"Streamed fresh count: {stream_result} (Matches: {stream_result == result})")
+
+# Stream a database file (or '-' for stdin) without loading it whole
+if len(sys.argv) > 1:
+    if sys.argv[1] == '-':
+        file_result = aoc_inventory_puzzle_stream(sys.stdin)
+    else:
+        with open(sys.argv[1], 'r') as f:
+            file_result = aoc_inventory_puzzle_stream(f)
+    print(f"Fresh IDs in {sys.argv[1]}: {file_result}")
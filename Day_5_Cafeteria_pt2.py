@@ -1,5 +1,107 @@
+import bisect
+import io
 import sys
 
+def merge_ranges(ranges):
+    """
+    Sorts (start, end) ranges and merges any that overlap or touch, returning
+    the disjoint merged ranges in increasing order.
+    """
+    if not ranges:
+        return []
+
+    # Sort the ranges by their start time lets get algorithmic BAYBAY
+    ranges = sorted(ranges, key=lambda x: x[0])
+
+    merged_ranges = []
+    current_start, current_end = ranges[0]
+
+    for next_start, next_end in ranges[1:]:
+        if next_start <= current_end + 1:
+            # Merge like its going out of business
+            current_end = max(current_end, next_end)
+        else:
+            merged_ranges.append((current_start, current_end))
+            current_start, current_end = next_start, next_end
+
+    merged_ranges.append((current_start, current_end))
+    return merged_ranges
+
+class FreshIntervalSet:
+    """
+    A live set of fresh IDs kept as disjoint, sorted intervals, for range lists
+    that change all day instead of being re-sorted and re-merged every run.
+
+    Intervals sit in two parallel sorted lists (starts and ends), so finding
+    the intervals an update touches is a pair of bisects. add() swallows every
+    interval the new range overlaps or touches; remove() trims or splits the
+    ones it cuts. The covered-ID total is adjusted on each update, so reading
+    it is O(1).
+    """
+    def __init__(self, ranges=()):
+        self.starts = []
+        self.ends = []
+        self.total_fresh_ids = 0
+        for start, end in merge_ranges([(start, end) for start, end in ranges if start <= end]):
+            self.starts.append(start)
+            self.ends.append(end)
+            self.total_fresh_ids += end - start + 1
+
+    def add(self, start, end):
+        """Marks every ID in [start, end] as fresh."""
+        if start > end:
+            return
+
+        # Intervals that overlap or touch [start, end]
+        lo = bisect.bisect_left(self.ends, start - 1)
+        hi = bisect.bisect_right(self.starts, end + 1)
+
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+            for i in range(lo, hi):
+                self.total_fresh_ids -= self.ends[i] - self.starts[i] + 1
+
+        self.starts[lo:hi] = [start]
+        self.ends[lo:hi] = [end]
+        self.total_fresh_ids += end - start + 1
+
+    def remove(self, start, end):
+        """Marks every ID in [start, end] as no longer fresh."""
+        if start > end:
+            return
+
+        # Intervals that overlap [start, end]
+        lo = bisect.bisect_left(self.ends, start)
+        hi = bisect.bisect_right(self.starts, end)
+        if lo >= hi:
+            return
+
+        kept_starts = []
+        kept_ends = []
+        # Only the first and last overlapping intervals can stick out past the cut
+        if self.starts[lo] < start:
+            kept_starts.append(self.starts[lo])
+            kept_ends.append(start - 1)
+        if self.ends[hi - 1] > end:
+            kept_starts.append(end + 1)
+            kept_ends.append(self.ends[hi - 1])
+
+        for i in range(lo, hi):
+            self.total_fresh_ids -= self.ends[i] - self.starts[i] + 1
+        for kept_start, kept_end in zip(kept_starts, kept_ends):
+            self.total_fresh_ids += kept_end - kept_start + 1
+
+        self.starts[lo:hi] = kept_starts
+        self.ends[lo:hi] = kept_ends
+
+    def __contains__(self, ingredient_id):
+        i = bisect.bisect_right(self.starts, ingredient_id) - 1
+        return i >= 0 and ingredient_id <= self.ends[i]
+
+    def __len__(self):
+        return len(self.starts)
+
 def aoc_inventory_puzzle(data):
     # Parse the shit
     sections = data.strip().split('\n\n')
@@ -24,21 +126,7 @@ def aoc_inventory_puzzle(data):
     if not ranges:
         return 0
 
-    # Sort the ranges by their start time lets get algorithmic BAYBAY
-    ranges.sort(key=lambda x: x[0])
-    
-    merged_ranges = []
-    current_start, current_end = ranges[0]
-
-    for next_start, next_end in ranges[1:]:
-        if next_start <= current_end + 1:
-            # Merge like its going out of business
-            current_end = max(current_end, next_end)
-        else:
-            merged_ranges.append((current_start, current_end))
-            current_start, current_end = next_start, next_end
-
-    merged_ranges.append((current_start, current_end))
+    merged_ranges = merge_ranges(ranges)
 
     # Calculate! Calculate!
     total_fresh_ids = 0
@@ -47,6 +135,34 @@ def aoc_inventory_puzzle(data):
 
     return total_fresh_ids
 
+def aoc_inventory_puzzle_stream(lines):
+    """
+    Streaming version of aoc_inventory_puzzle: ranges are read line by line from
+    any iterable of lines (an open file, sys.stdin) straight into a
+    FreshIntervalSet, and reading stops at the blank line before the ID
+    section, so memory is bounded by the number of ranges.
+    """
+    fresh_set = FreshIntervalSet()
+    seen_range = False
+
+    for line in lines:
+        line = line.strip()
+        if not line:
+            # Blank lines before the ranges are padding; after them, the divider
+            if seen_range:
+                break
+            continue
+
+        seen_range = True
+        try:
+            start, end = map(int, line.split('-'))
+        except ValueError:
+            print(f"Warning: Invalid range format dumb bitch: {line}")
+            continue
+        fresh_set.add(start, end)
+
+    return fresh_set.total_fresh_ids
+
 puzzle_input = """
 147026054002176-148722820532628
 405816093648050-406348543340995
@@ -1235,3 +1351,21 @@ puzzle_input = """
 result = aoc_inventory_puzzle(puzzle_input)
 print("--- Inventory System Analysis (Part 2 - Optimized) ---")
 print(f"Total Unique Fresh Ingredient IDs found: {result}")
+
+# Build the live interval set from the same ranges and read its running total
+fresh_set = FreshIntervalSet()
+for line in puzzle_input.strip().split('\n\n')[0].split('\n'):
+    fresh_set.add(*map(int, line.split('-')))
+print(f"Interval set total: {fresh_set.total_fresh_ids} (Matches: {fresh_set.total_fresh_ids == result})")
+
+stream_result = aoc_inventory_puzzle_stream(io.StringIO(puzzle_input))
+print(f"Streamed total: {stream_result} (Matches: {stream_result == result})")
+
+# Stream a database file (or '-' for stdin) without loading it whole
+if len(sys.argv) > 1:
+    if sys.argv[1] == '-':
+        file_result = aoc_inventory_puzzle_stream(sys.stdin)
+    else:
+        with open(sys.argv[1], 'r') as f:
+            file_result = aoc_inventory_puzzle_stream(f)
+    print(f"Fresh IDs covered in {sys.argv[1]}: {file_result}")
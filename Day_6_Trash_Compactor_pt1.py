@@ -1,3 +1,8 @@
+import multiprocessing
+import os
+
+import numpy as np
+
 def solve_cephalopod_math(worksheet_input: str) -> int:
     """
     Solve the cephalopod math worksheet and
@@ -79,14 +84,114 @@ def calculate_problem(problem_columns: list[str]) -> int:
         # Addition: sum all numbers
         return sum(numbers)
     elif operator == '*':
-        # Multiplication: multiply all numbers
-        result = 1
-        for num in numbers:
-            result *= num
-        return result
+        # Multiplication: multiply all numbers, pairwise so big products stay balanced
+        return product_tree(numbers)
         
     return 0
 
+
+def load_worksheet_matrix(worksheet_input):
+    """
+    Loads the worksheet as a (rows x max_len) uint8 byte matrix, padded with
+    spaces on the right just like the ljust in solve_cephalopod_math.
+    """
+    if isinstance(worksheet_input, str):
+        worksheet_input = worksheet_input.encode()
+    lines = worksheet_input.strip(b'\n').split(b'\n')
+
+    max_len = max(len(line) for line in lines)
+    grid = np.full((len(lines), max_len), ord(' '), dtype=np.uint8)
+    for row, line in enumerate(lines):
+        grid[row, :len(line)] = np.frombuffer(line, dtype=np.uint8)
+    return grid
+
+
+def iter_problem_blocks(grid):
+    """
+    Yields each problem of a worksheet byte matrix as a block of columns.
+
+    The matrix is transposed once, so every block is a (width x rows) view where
+    block[c] is one worksheet column, top to bottom. Separator columns are found
+    in one vectorized all(axis=0) instead of building a string per column.
+    """
+    columns = grid.T
+    is_separator = np.all(grid == ord(' '), axis=0)
+
+    # Pad with separators so every problem has a start edge and an end edge
+    edges = np.flatnonzero(np.diff(np.concatenate(([1], is_separator, [1])).astype(np.int8)))
+    for start, end in zip(edges[0::2], edges[1::2]):
+        yield columns[start:end]
+
+
+def product_tree(numbers) -> int:
+    """
+    Multiplies numbers pairwise in a balanced tree instead of one at a time, so
+    the big multiplications happen between operands of similar size rather than
+    one huge running product times a small number, over and over.
+    """
+    numbers = list(numbers)
+    if not numbers:
+        return 1
+    while len(numbers) > 1:
+        paired = [numbers[i] * numbers[i + 1] for i in range(0, len(numbers) - 1, 2)]
+        if len(numbers) % 2:
+            paired.append(numbers[-1])
+        numbers = paired
+    return numbers[0]
+
+
+def calculate_problem_block(problem_block) -> int:
+    """
+    calculate_problem for a (width x rows) byte block from iter_problem_blocks.
+    Numbers are read across each row of the problem, same as calculate_problem.
+    """
+    num_rows = problem_block.shape[1]
+
+    operator_row = problem_block[:, num_rows - 1]
+    operator_chars = operator_row[operator_row != ord(' ')]
+    operator = chr(operator_chars[0]) if operator_chars.size else None
+
+    if operator not in ('+', '*'):
+        return 0
+
+    numbers = []
+    for row_idx in range(num_rows - 1):
+        number_str = problem_block[:, row_idx].tobytes().strip()
+        if number_str:
+            numbers.append(int(number_str))
+
+    if not numbers:
+        return 0
+
+    if operator == '+':
+        return sum(numbers)
+    return product_tree(numbers)
+
+
+def solve_cephalopod_math_numpy(worksheet_input) -> int:
+    """
+    Columnar version of solve_cephalopod_math: one byte matrix, one transpose,
+    and problem blocks as views, with no per-column strings.
+    """
+    grid = load_worksheet_matrix(worksheet_input)
+    return sum(calculate_problem_block(block) for block in iter_problem_blocks(grid))
+
+def solve_cephalopod_math_parallel(worksheet_input, workers=None) -> int:
+    """
+    Process pool version of solve_cephalopod_math: problem blocks are spread
+    across workers and evaluated with calculate_problem_block.
+    """
+    grid = load_worksheet_matrix(worksheet_input)
+    blocks = list(iter_problem_blocks(grid))
+    if not blocks:
+        return 0
+
+    workers = workers or os.cpu_count() or 1
+    # Send blocks over in batches so the pickling overhead stays small
+    batch_size = max(1, len(blocks) // (workers * 4))
+    with multiprocessing.Pool(min(workers, len(blocks))) as pool:
+        return sum(pool.imap_unordered(calculate_problem_block, blocks, batch_size))
+
 puzzle_input = """
 617 828 937 2344 145 37   83  845 37   7 882 928 48 929 79  69 119   36 95   7 12  2  778 7  9   1897 361 1   988 84 86 978  5 737 3  973  3 518 31  3  57  92 61 9488 491  6 86  238 53 841 79  664 22 9   84 8  368 982 5   9    93 653 52  93   66 5   81   688  25 886 67   8 462  9 1  473 3753 391 929 236 9     98  9 6139   5 9  2  67 6  9  2739 1189 43 14  49 26  5 2661 73 588 291 296 84 52  382 5891 95  9   9 477 1     3 174 595 69   88 16  56 29 6  6  482 8817 582 116 68 489  5 366 19  23 3441 256  24 193 5671 59  34   8 675  4 27 287 61 77 2  225 56  97   2121 95   28 3  914 9   3995 874 317 13 858 64 6261 44 285 68  9 4149  2 155  96  2 84 46 21 8134 712 795  5 19  3  8    4691 95 157 944  26   8 375  116 65 8  536   4 768 94 359 8   475 1854   2 7316  7 7   919 12 29 5195  7 95  87 87   21 5279  7 63   953 77   6    898 24  51 41  8 975 69 611  5 131 773 9  343  91    4 436 79 49 24 4545 776  89 415   86 6  55   16 751 29  2585 37 966 321  91 6534 839 88   16 91 73 756 93 65 217 74 1469 254 74 6736 17    349 86   31  75 34 947 93 41 7759 654 87 15 39 22 55   7282 33 87  9 437 8918  65 27 344 9527 948 54   1 42  93 427 82 242 936 67  38 1   81 97   4 4519 42 959 81  92 42 56 1295   8   7 43  2    6742 81    2 3  776 99 7  8   89  6 512 542 18 73  924 493  51 66 665  35 3444 253   47 955  4 7826 329  1 92 7189   2  22  5 333 77 892 92 29  26 8   5 32 24 98  78 1  361 528 28 27 94 9612 5   281  32 2   693 867 85 43 5   77   7 22  61 6   138 81 684 76  22 886  49 39 22 4  938 45 9    6  2876 2  72  85 928 84 55 88   89 511  5 638 329  35 21 35  24 7  86 96   9 891  6   2   15   5 1773 39 41 96 4  4666 832   53 53 13 954   83  679 18 3964 74 149  65  8   428 61 783 9  9   53 69 12   3 29 472 88 936 117 7698 21 597 982   8 37 86 4   61 67 7367 737 4182 84 64 61  77 58   284 4892 84 581 38  695 26      3 93 4  189 116 91 854   5 92  95 41  18 888  3 13  746 8   21 9534 4172 468 223 47 968  33  875 969 62 23 645 517 87 154 5241 14  4 328 415 552 11  594 71 7  27 972 25   33  81 14 639 8296 8695 234 83 43 46 13  34 48 387 985 266 525 999 294 74 773  6 249  855 557 613 86 568  64 3   78 9388 87 7   86 66 924 12 12 74 76 6  7  19 6256 88    3   35 694 28 9439 48 827 66 13 8729 62 2145 86 6   87  1   49 6724 56   5   171  2 512  23 73 59    35  5 272 228 39 52 39  2529  26 51 18 315 152 35 7193 835 5  423 5193 56 582 796 697 548  4 29 48 282 1    34  79 99 11  15 75  641 343 224 213 725   1 87 73   65  5 44 9959 43 5543 299 7413 525 764 6899 976 21 85  1    6  853 833 62 75   91 8    4 15 51 51   1 462 435 7615 35 622 34 111 1  435 766 375 7   6  842 48 4279 1   6286 1859   4 44 28 361 62   45 62 6   812 115 7   491  4 6892 4297 159  59 865  53 99  6 73   55  99 47 648 69 193 5  19 698 67   535 4   95 72 46  14 5441 8717 84 17 864 84 41 52 49 17    1 46 2    5 129  5 775 33 31  347  7 47  54  5 86 75 32 158 93 73   7 79 53 974  219 5   36 8537 199 52 8393 765   47 3465 12 264 13 214 39 389 4267 74 72 3   594   6 53 334 62 4528 99 39 774 93 147 32 439 36 549 7285 69 498 51 545 82 87 77 79 58  23 1   741 374   1  7 832  51 23 35 4524 5682 9131 3455 18  13 35 9582 924 75 3    366 728 18 64 171 679 2   23 29  5 2648 255 36   2 6314 7   5       3 6377 72 5  14 72 4448 542 1124 51 238 343 5521 194 368 74   482 26 586 94 71  42   2825 959 6    8 13  94 38  53  68 855 4299  3 73 277 78 79    1 7   726 699 17  35  76  648 891 913 259 41   7 21 8   17  86 861   34 533   1    3 5   11 486  8 5  672  44 2  27 82   5 52  872 7   71 529 399 73 24 96    1 33 77 7125 87 59 2465 349 4151  158 288 93  69  5 9   73 26 16 392 77 117 88  5259 373  141   72  2 61 2193 87 764 84 1879 435 97  96 162  715 33 491 1    382 145 56  31 37 49 976 6    36 5  852 656 74  47  93 87 8794 51 27 7211 9918   3 63 94   3 57 758 3  954 49 57 32  895
 478 337 998 3442 618 226  22   45 656 66  47 653 36  72 821 27 957 8263 63  13 515 1  358 8  476 1485 662 293 775 65 88 541 61 851 52 487 72 775 98 17 156 427 91 2892 682 89 483 239 14 491 51  579 76 2   59 4  311 996 19  96   84 428 551 785  81 48  123  158  35 556 96  69 324  3 5  961 3222 492 436 948 156   73 44 6856  84 54 89 91 91 21 3297 3353 43 76  54 16  4 6197 38 734 959 947 2  678 145 5191 13  2   1 622 73   72 617 881 77  386 38  76 65 14 87  37 8719 432 435 54 122 47 985 28  81  135   8  15 828 3272 314 585  6 933  7 16 469 62 61 93 891 66  315  1666 44 4897 37 875 1   7689 328 271 57 714 71 1786 79 565 91  6 5462 11 635  25  8 44 15 79 4251  17 228  3 77  46 35   2978 82 999 2364 55   7 366  116 44 4  8848  3 11  76 333 52  589 465   82 4397 97 61  322 64 29 441  57 65  87 553 697 4616 84 88    71 521  56   274 689 91 17 54  17 63 219  7 234 21  52 3267 116 221 399 28  1 34 6832 796  39 249 2419 37 37 3556 381 35  9377 45 299 857 642 8919 47  45  113 74 53 381 28  6 724 22 8713 751 15 8837 61    371 7621 493 47 38 766 51 3  6128 355 37 86 88 84 351    59 51 88 22 929  116 615 64 123 5624 576 84  38 993 71 833 64 399 838 86  73 19  15  6 561 1183 12 573 23 421 89 48 7811  93  44 44  7497 93   481  18 3  829 79 47 841 77  3 523 834 62 16 4558 2894 18 94 157  95 1972 889 7953 643 77 7639 154  5 92 6595  24 352  3 998 58 531 36 45 864 83 28 6  38 96  33 6  624  89 86 45 95 1137 89  153 792 3   16  9   86 87 3  555  49 781 79 25  546 74 668 31  36 726  49 25 98 17 884 36 14   5  8169 8  81  72 245 15 95 65   11 992  8 488 7191 51 67 668 85 85 83 49 131 256  899 6   57 746  678 12 99 52 2  1911 588   59 39 39 698  323  847 78 5735 61 836  48  589 255 89 328 18 521 88 11 489  6 51 916 57 136 733 8894 98 975 252   8 87 74 48  85 44 5318 792 7675 34 24 259 55 42   899 4365 8  882 36  94  162   627 91 9  861 926 77 975  11 97 458 24  58 859 99 496 891 4  565 1315 84   967 134 55 753  87  778 188 64 65 319 896 74 143 7723 13  3 877 258   2 271 376 55 2  77 494 1237 13 942 91 892 4141 4636 397 27 79 33 23  33 33 194 278 247 877  35 491 61 661  3 415  857 882 499 69 925 196 76 927 6519 62 38  22 11 369 63 82 67 27 13 87 37  122 84  518  432 221 58 1151 97 244 99 39 6781 45 2915 73 61  29  85  18 9268 655  437 822  5 963 586 92 679  992  8 238  84 52 64 44  2982  13 57 59 1   564 92 4994 529 1  318 4924 76 567 136 792 386  4 51 71 631 214 438 325 24 32  24 24  255 472 579 956 234  84 57 413  77  6 15 5439 38  959 535 3839 559 788 2161 879 44 541 41   1  286 859 84 67 3647 58   2 24 48 57 968 283 642 5763 95 352 27 933 69 724 277 778 5   7  456 23 662  6   3637 2354  59 35 67 833 556  27 29 27  589 718 24  548  5 7781 124  769  85 635  58 68 72 21 2449 694 36 859 95 434 6  71 811 999   59 7   31 71 71  46 1354 3924 72 56 327 26 82 53 36 46   48 14 4    8 75  34 877 41 276 582  8 83  84 72  3 86 46 787 18 62  25 96 65 7935 224 62  35 8171 178 41 4835 166   31 8631 77 389 73 388 76 965 1294 41 76 91  619  56 73  23 94 5169 82 68 963 71 321 78 427 66 147 9524 64 113 65 799 97 21 35 24 37  98 26  525 388  95  1 8282 41 62 66 7263 2711 9599 3359 36  54 82 7184 94  56 68  2139 943 22 93 688 898 3   22 72 37 6644 265 75  35 592  765 137   375 3685 9  43 68 87 7663 927 2425 12 766 621 1788 719  93 624  756 86 533 37 162 4753 1232 216 41  69 41 994 45  89 436 195 9199 77 57 31  42 89 4384 99  861 143 55  63  756 622 137 939 712 95  15 14 743 26  62 795 6689 7783 18   83 51  18 343 23 95 48  989 4   8 73 873 48  494 23  89 623 527 26 46 956   4 74 49 4242 47 37 4797 419 4869  183 118 461 46  7 2   67 53 28 633 55 718 917 7533 5585 622  738  1 2  7248 74 831 88 6387 645 98  55 915 9255 41 115 879  944 231 19  36 15 88 35  61   97 8  153 974 91  41  26 42 7924 16 65 7192 1995 637 28 92  91 37 719 1  435 44 45 28  951
@@ -95,7 +200,17 @@ puzzle_input = """
 *   +   *   +    +   +    *   *   *   *  +   +   *  +   +   *  +   +    *   +  +   +  +   *  +   +    *   *   +   +  *  *   *  +   *  +   *  *   *  *  +   *   *  +    *   *  *   *   +  *   *   +   *  +   *  +  +   *   *   +    +  +   *   +   *   +   +   +    *   *   *   *  +   +  *  *   +    *   *   *   +    +   *  +    *   +  +  *  +  *  +    +    *  +  *   +  +  +    *  *   +   *   +  +   *   +    +  *  +   *   +  +    *   +   *  +    *  *   *  *  +  +   +    *   +   *  *   *  +   +  *   +    +   *   +   +    +   +   *  +   *  +  +   +  +  *  +   *   +    +    *  +    +  *   *   +    *   +   +  +   *  +    +  *   *  +  +    *  +   +   *  +  *  +  +    *   +   +  *   +  +    +    *  *   +    +  *   +    *   +  *  +    +  *   +  *   +   *   +    *   +    +  *   *   +  +  +    *  *  *   +   *   +    +  +    *   +    +    +   +   +  *  *  *   *  *   +  +   *   *  +    *   *   *   +  +  +  +    +   *   *   +    +  *  +    *   +   +    +  *   +   +   +    *   +  +    *  +  *   *  *  *   *  +    +   *  +    +    +    +    *   *  +  *   +  +  +    *   *  +  +  *  +    +    *  +  *  +   +    *   +  +   +    +   *  +   +   *  *   *  *   *   +  *   +   +  *  *   +    *  *   *  +   *  +  +    *   *   *   +    +    *   *   +  *   *  *  +   *  *  *   *   *  *  +    +    *  +  +    +  +    +   +    +   +  +    +   +  *  +    +   +   +  *   *  +   *  *  *   *  *  +  +  *   *  *  *   *   +  *  *  +    +   *   *   *   +   *   *  *  *  *   +   *   *  +   *   +  +   *   *  *   +   *  *  *  +   *  +    +  +    +  *  +   *   *  *  *  +    +   *  *   +    *  *  *   +  +  +  +  *   +    +   *   *  +   +    +  +  +  *  +    +    *   *  *  *   +    +    +  +    *  +    +   +   *   *  *   +  *   *  *  *   +  *  +   *  *   +   +    *  *   *   *   +  *  +  +   +  +    *   +    *  +  +   *  +   +    +    +  *   *   *   +    +    *  +  +   *   +  *   +   *  *   *   +  +   *  +   *   *  +   +    +    *   *   *  +    *   *   +   +  *  *   *   *  +   +    +  +  +   +   *   *   *   +  *  +  *   +    +  +   *  *   +    +    *   +  +  *  +  *   +  *   +   +   *   +   *   +  *   +  +    *   +   *   +  *   +   *  +   +    *  +   +  *  +   +  +  *  *  +  +  *  +    +   *   +    +   *  +    +  *   +  *  +    +  +    +  *   *   +   *  +    +    *   *   +  *   *   *  +    +   *  +   +   +  *  +   +    +   *  +  *   +   +  +    *   +  *   +    +  *   +   *   *   +  *  *  *   +   *   +   *  *   *  *   +   +   +   *   *   +   *  *   *   *  +  +    *  +    +   +    *   *   +    *   +  +   +    *  *   *   +  +  +    *   *  *  *  *  +   *   *   +    +  *   +  +   +  +   +   *   *   +  +   *  +    +   +    +    +   *  *  *   +   +   +  *   +   *   +   *   *  +    +    +   +   +    *  *  +  *  +    *   *  *   *  +   *  +  +   +    *   *   *  +  *  +   +    +    *  *  +   +  *  *  *  +   *   +  +   *  +   *  *   +  *   *   +  *   +  +  +  +  *  *   +  *  *   *  +  +    *   *   *  +    +   +  +    *   +    +    *  +   *  +   *  *   +    +  +  +   +   +   *  *   +  +    +  *  +   *  *   +  +   *  *   +    +  *   *  +   +  *  *  +  *  +   +   +   *   +   *  +    +  +  *  +    +    +    +    *   *  *  +    +   +  *   +    *   +  +  *   +   *   *  *  *  +    +   *  *   +    +   +    +    +    *  *  +  *  +    +   +    *  +   *   +    *   *   +    +   +  *   *  *   +    +    +   +   +  *  *   +  +   +   +   +    *  *  *   *  +  +    *   +   *   +   *   *   +   *   *   *   *  +   +  +   +   +  *   +    +    *  +    *   +  *   +  *  *   *   *  +  *  *   *   +   *   *  *   *   *  *  *   +   +  +  +    +  +  +    +   +    +    *   +   +  *  *   *  *  *  +   *  *   *   +    +    *   +    +  +  +    *  *   *  +    *   +  +   *   +    *  *   +   +    +   *   +  *  *  +   +    +  +  *   *   +   +   *  *  +    *  +  +    +    *   *  *   +  +  *   +  +   +  *  +   +  
 """
 
-# The grand total is! (Please please please):
-grand_total = solve_cephalopod_math(puzzle_input)
+if __name__ == "__main__":
+    # The grand total is! (Please please please):
+    grand_total = solve_cephalopod_math(puzzle_input)
+
+    print(f"Grand Total: {grand_total}")
+
+    # Cross-check the columnar parser against the string version
+    numpy_total = solve_cephalopod_math_numpy(puzzle_input)
+    print(f"Columnar Grand Total: {numpy_total} (Matches: {numpy_total == grand_total})")
+
+    # Spread the problems over a process pool and cross-check again
+    parallel_total = solve_cephalopod_math_parallel(puzzle_input)
+    print(f"Parallel Grand Total: {parallel_total} (Matches: {parallel_total == grand_total})")
 
-print(f"Grand Total: {grand_total}")
@@ -1,3 +1,11 @@
+import sys
+
+import numpy as np
+
+from grid_loader import MappedGrid
+
+INT64_HEADROOM = np.iinfo(np.int64).max // 3
+
 def tachyon_manifold(manifold_diagram: str) -> int:
     """
     Analyzes the tachyon manifold diagram to count the total number of beam splits.
@@ -76,6 +84,74 @@ def tachyon_manifold(manifold_diagram: str) -> int:
 
     return total_splits
 
+def load_manifold_grid(manifold_diagram):
+    """
+    Parses the diagram into a (rows x cols) uint8 NumPy array of characters.
+    Short rows are padded with empty space to the width of the first row.
+    A MappedGrid is used straight off its memory map, with no per-row strings.
+    """
+    if isinstance(manifold_diagram, MappedGrid):
+        return manifold_diagram.as_array()
+
+    lines = manifold_diagram.strip().split('\n')
+    if not lines[0]:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    cols = len(lines[0])
+    padded = "".join(line[:cols].ljust(cols, '.') for line in lines)
+    return np.frombuffer(padded.encode(), dtype=np.uint8).reshape(len(lines), cols)
+
+
+def propagate_beams_numpy(manifold_diagram):
+    """
+    Moves the whole beam front down the manifold one row at a time with array shifts.
+
+    Returns (total_splits, total_timelines) from a single pass: a boolean beam
+    vector follows tachyon_manifold's rules for the split count, and a count vector
+    follows quantum_tachyon_manifold's rules for the timelines. Counts stay in exact
+    int64 until a row could overflow it, then carry on as Python ints (object dtype).
+    """
+    grid = load_manifold_grid(manifold_diagram)
+    if grid.size == 0:
+        return 0, 0
+    start_cols = np.flatnonzero(grid[0] == ord('S'))
+    if start_cols.size == 0:
+        return 0, 0
+
+    C = grid.shape[1]
+    beams = np.zeros(C, dtype=bool)
+    beams[start_cols[0]] = True
+    counts = np.zeros(C, dtype=np.int64)
+    counts[start_cols[0]] = 1
+
+    total_splits = 0
+
+    for row in grid:
+        splitters = row == ord('^')
+        passes = (row == ord('.')) | (row == ord('S'))
+
+        # Split count: beams merge, so a bool per column is enough
+        hits = beams & splitters
+        total_splits += int(np.count_nonzero(hits))
+        # tachyon_manifold drops both halves of a split made in the first column
+        hits[0] = False
+        next_beams = beams & passes
+        next_beams[:-1] |= hits[1:]
+        next_beams[1:] |= hits[:-1]
+        beams = next_beams
+
+        # Timelines: a cell can collect from above and from splitters on both sides
+        if counts.dtype != object and counts.max() > INT64_HEADROOM:
+            counts = counts.astype(object)
+        split_counts = np.where(splitters, counts, 0)
+        next_counts = np.where(passes, counts, 0)
+        next_counts[:-1] += split_counts[1:]
+        next_counts[1:] += split_counts[:-1]
+        counts = next_counts
+
+    # tolist() gives Python ints, so the total can't overflow either
+    return total_splits, sum(counts.tolist())
+
 manifold_input = """
 ......................................................................S......................................................................
 .............................................................................................................................................
@@ -223,3 +299,13 @@ manifold_input = """
 
 beam_splits = tachyon_manifold(manifold_input)
 print(f"Total splits: {beam_splits}")
+
+# Cross-check the array engine against the set-based walk
+numpy_splits, _ = propagate_beams_numpy(manifold_input)
+print(f"Vectorized splits: {numpy_splits} (Matches: {numpy_splits == beam_splits})")
+
+# Run a manifold file straight off its memory map
+if len(sys.argv) > 1:
+    with MappedGrid(sys.argv[1]) as mapped_grid:
+        file_splits, _ = propagate_beams_numpy(mapped_grid)
+    print(f"Total splits in {sys.argv[1]}: {file_splits}")
@@ -1,3 +1,12 @@
+import itertools
+import sys
+
+import numpy as np
+
+from grid_loader import MappedGrid
+
+INT64_HEADROOM = np.iinfo(np.int64).max // 3
+
 def quantum_tachyon_manifold(manifold_diagram: str) -> int:
     """
     Calculates the total number of timelines created by a single quantum tachyon
@@ -72,6 +81,119 @@ def quantum_tachyon_manifold(manifold_diagram: str) -> int:
 
     return total_timelines
 
+def quantum_tachyon_manifold_sweep(manifold_diagram) -> int:
+    """
+    Iterative version of quantum_tachyon_manifold: no recursion and no (r, c) memo.
+
+    Sweeps down the manifold one row at a time carrying a timeline count per column.
+    Splitters send their count to c - 1 and c + 1 and open cells pass it straight
+    down, so it runs in O(R*C) time and O(C) memory however tall the manifold is.
+    Takes the diagram text or a MappedGrid.
+    """
+    if isinstance(manifold_diagram, MappedGrid):
+        C = manifold_diagram.cols
+        rows = (manifold_diagram.row(r) for r in range(manifold_diagram.rows))
+    else:
+        lines = manifold_diagram.strip().split('\n')
+        C = len(lines[0])
+        rows = (line.encode() for line in lines)
+
+    first_row = next(rows, None)
+    if first_row is None:
+        return 0
+    start_col = bytes(first_row).find(b'S')
+    if start_col == -1:
+        return 0
+
+    counts = [0] * C
+    counts[start_col] = 1
+
+    for row in itertools.chain([first_row], rows):
+        next_counts = [0] * C
+        for c, count in enumerate(counts):
+            if not count:
+                continue
+            cell = row[c]
+            if cell == ord('^'):
+                if c > 0:
+                    next_counts[c - 1] += count
+                if c + 1 < C:
+                    next_counts[c + 1] += count
+            elif cell == ord('.') or cell == ord('S'):
+                next_counts[c] += count
+        counts = next_counts
+
+    # Every count still alive below the last row is a completed timeline
+    return sum(counts)
+
+def load_manifold_grid(manifold_diagram):
+    """
+    Parses the diagram into a (rows x cols) uint8 NumPy array of characters.
+    Short rows are padded with empty space to the width of the first row.
+    A MappedGrid is used straight off its memory map, with no per-row strings.
+    """
+    if isinstance(manifold_diagram, MappedGrid):
+        return manifold_diagram.as_array()
+
+    lines = manifold_diagram.strip().split('\n')
+    if not lines[0]:
+        return np.zeros((0, 0), dtype=np.uint8)
+
+    cols = len(lines[0])
+    padded = "".join(line[:cols].ljust(cols, '.') for line in lines)
+    return np.frombuffer(padded.encode(), dtype=np.uint8).reshape(len(lines), cols)
+
+
+def propagate_beams_numpy(manifold_diagram):
+    """
+    Moves the whole beam front down the manifold one row at a time with array shifts.
+
+    Returns (total_splits, total_timelines) from a single pass: a boolean beam
+    vector follows tachyon_manifold's rules for the split count, and a count vector
+    follows quantum_tachyon_manifold's rules for the timelines. Counts stay in exact
+    int64 until a row could overflow it, then carry on as Python ints (object dtype).
+    """
+    grid = load_manifold_grid(manifold_diagram)
+    if grid.size == 0:
+        return 0, 0
+    start_cols = np.flatnonzero(grid[0] == ord('S'))
+    if start_cols.size == 0:
+        return 0, 0
+
+    C = grid.shape[1]
+    beams = np.zeros(C, dtype=bool)
+    beams[start_cols[0]] = True
+    counts = np.zeros(C, dtype=np.int64)
+    counts[start_cols[0]] = 1
+
+    total_splits = 0
+
+    for row in grid:
+        splitters = row == ord('^')
+        passes = (row == ord('.')) | (row == ord('S'))
+
+        # Split count: beams merge, so a bool per column is enough
+        hits = beams & splitters
+        total_splits += int(np.count_nonzero(hits))
+        # tachyon_manifold drops both halves of a split made in the first column
+        hits[0] = False
+        next_beams = beams & passes
+        next_beams[:-1] |= hits[1:]
+        next_beams[1:] |= hits[:-1]
+        beams = next_beams
+
+        # Timelines: a cell can collect from above and from splitters on both sides
+        if counts.dtype != object and counts.max() > INT64_HEADROOM:
+            counts = counts.astype(object)
+        split_counts = np.where(splitters, counts, 0)
+        next_counts = np.where(passes, counts, 0)
+        next_counts[:-1] += split_counts[1:]
+        next_counts[1:] += split_counts[:-1]
+        counts = next_counts
+
+    # tolist() gives Python ints, so the total can't overflow either
+    return total_splits, sum(counts.tolist())
+
 manifold_input = """
 ......................................................................S......................................................................
 .............................................................................................................................................
@@ -219,3 +341,17 @@ manifold_input = """
 
 timelines = quantum_tachyon_manifold(manifold_input)
 print(f"Total timelines: {timelines}")
+
+# Cross-check the row sweep against the recursive version
+sweep_timelines = quantum_tachyon_manifold_sweep(manifold_input)
+print(f"Row sweep timelines: {sweep_timelines} (Matches: {sweep_timelines == timelines})")
+
+_, numpy_timelines = propagate_beams_numpy(manifold_input)
+print(f"Vectorized timelines: {numpy_timelines} (Matches: {numpy_timelines == timelines})")
+
+# Sweep a manifold file straight off its memory map
+if len(sys.argv) > 1:
+    with MappedGrid(sys.argv[1]) as mapped_grid:
+        file_timelines = quantum_tachyon_manifold_sweep(mapped_grid)
+        _, file_numpy_timelines = propagate_beams_numpy(mapped_grid)
+    print(f"Total timelines in {sys.argv[1]}: {file_timelines} (Vectorized matches: {file_numpy_timelines == file_timelines})")
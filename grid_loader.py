@@ -0,0 +1,99 @@
+import mmap
+import os
+
+import numpy as np
+
+class MappedGrid:
+    """
+    A character grid read straight out of a memory-mapped input file.
+
+    The grid days (Day 4, Day 7) read rectangular diagrams, so every row sits at a
+    fixed stride in the file: the row width plus its line ending. Rows come back as
+    zero-copy memoryview slices, and as_array() is a (rows x cols) uint8 NumPy view
+    over the same mapping, so nothing is read until a solver touches it and no
+    per-row Python strings are ever built.
+    """
+    def __init__(self, input_filepath):
+        self.input_filepath = input_filepath
+        with open(input_filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuses empty files; an empty file is just a 0x0 grid
+                self._map = None
+                self.rows = self.cols = 0
+                self.stride = 1
+                self.offset = 0
+                return
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        size = len(self._map)
+        # Blank lines may lead as well as trail; the grid starts at the first
+        # byte that isn't a line ending
+        self.offset = 0
+        while self.offset < size and self._map[self.offset] in b'\r\n':
+            self.offset += 1
+
+        line_end = self._map.find(b'\n', self.offset)
+        if line_end == -1:
+            # A single row with no line ending
+            self.cols = size - self.offset
+            self.stride = self.cols + 1
+        else:
+            self.cols = line_end - self.offset
+            self.stride = self.cols + 1
+            if self.cols > 0 and self._map[line_end - 1] == ord('\r'):
+                self.cols -= 1
+
+        # The last row may or may not have a line ending, and blank lines may trail
+        content_end = size
+        while content_end > self.offset and self._map[content_end - 1] in b'\r\n':
+            content_end -= 1
+        content_size = content_end - self.offset
+        self.rows = (content_size + self.stride - 1) // self.stride if self.cols else 0
+
+        if self.rows and content_size != (self.rows - 1) * self.stride + self.cols:
+            raise ValueError(f"'{input_filepath}' is not a rectangular grid")
+        if self.rows > 1:
+            line_ends = np.ndarray(
+                (self.rows - 1,), dtype=np.uint8, buffer=self._map,
+                offset=self.offset + self.stride - 1, strides=(self.stride,),
+            )
+            if not np.all(line_ends == ord('\n')):
+                raise ValueError(f"'{input_filepath}' is not a rectangular grid")
+
+    def row(self, r):
+        """Zero-copy view of row r (a memoryview of cols bytes)."""
+        start = self.offset + r * self.stride
+        return memoryview(self._map)[start:start + self.cols]
+
+    def as_array(self):
+        """Zero-copy (rows x cols) uint8 view of the whole grid."""
+        if self._map is None or not self.rows:
+            # Nothing but line endings in the file
+            return np.zeros((0, 0), dtype=np.uint8)
+        # Going through a memoryview makes the array hold a buffer export on the
+        # map, so the map can't be unmapped underneath it
+        return np.ndarray(
+            (self.rows, self.cols), dtype=np.uint8, buffer=memoryview(self._map),
+            offset=self.offset, strides=(self.stride, 1),
+        )
+
+    def close(self):
+        """
+        Unmaps the file. While a row() or as_array() view is still alive the map
+        can't be closed, so instead of raising BufferError (which from __exit__
+        would hide the exception already on its way out) it is left for the
+        garbage collector to unmap once the last view is gone.
+        """
+        if self._map is None:
+            return
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()